@@ -13,6 +13,9 @@ DB_PASS = os.getenv("PGPASSWORD", "postgres")
 POLICIES_CSV = os.getenv("POLICIES_CSV", "policies_light.csv")
 PLAYBOOK_CSV = os.getenv("PLAYBOOK_CSV", "playbook_rules_light.csv")
 
+# Rows per multi-row VALUES statement sent by execute_values (default is 100)
+PAGE_SIZE = int(os.getenv("IMPORT_PAGE_SIZE", "1000"))
+
 def connect():
     return psycopg2.connect(
         host=DB_HOST, port=DB_PORT, dbname=DB_NAME, user=DB_USER, password=DB_PASS
@@ -35,7 +38,7 @@ def load_policies(conn, csv_path):
         extras.execute_values(cur, '''
             INSERT INTO policies (policy_text, policy_category, severity_default)
             VALUES %s
-        ''', rows)
+        ''', rows, page_size=PAGE_SIZE)
     conn.commit()
 
 def _split_list(val):
@@ -53,7 +56,7 @@ def load_playbook(conn, csv_path):
                 _split_list(r.get("applicable_contract_types","")),
                 _split_list(r.get("applicable_clauses","")),
                 r.get("severity_override") or None,
-                json.loads(r.get("conditions") or "{}"),
+                extras.Json(json.loads(r.get("conditions") or "{}")),
                 r["model_orientation"],
             ))
     with conn.cursor() as cur:
@@ -63,7 +66,7 @@ def load_playbook(conn, csv_path):
               severity_override, conditions, model_orientation
             )
             VALUES %s
-        ''', rows)
+        ''', rows, page_size=PAGE_SIZE)
     conn.commit()
 
 def main():
@@ -3,16 +3,65 @@ SQLite version of the schema - works without Docker/PostgreSQL
 Usage: python3 setup_sqlite.py
 """
 
+import os
 import sqlite3
 import csv
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 DB_PATH = "../legal_assistant.db"
 
+def dump_json_array(values):
+    """Serialize a list for a JSON text column"""
+    if orjson is not None:
+        return orjson.dumps(values).decode()
+    return json.dumps(values)
+
+def apply_bulk_load_pragmas(conn):
+    """Relax durability for bulk loads (disable with SQLITE_FAST_LOAD=0)"""
+    if os.getenv("SQLITE_FAST_LOAD", "1") == "0":
+        return
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+    """)
+
+def _split_list(value):
+    """Split a semicolon-separated CSV cell into a list"""
+    return [x.strip() for x in (value or '').split(';') if x.strip()]
+
+def _policy_rows(reader):
+    for row in reader:
+        yield (
+            row['policy_text'],
+            row.get('policy_category'),
+            row.get('severity_default', 'medium')
+        )
+
+def _rule_rows(reader):
+    for row in reader:
+        # Convert semicolon-separated lists to JSON arrays
+        yield (
+            row['rule_text'],
+            dump_json_array(_split_list(row.get('applicable_contract_types'))),
+            dump_json_array(_split_list(row.get('applicable_clauses'))),
+            row.get('severity_override') or None,
+            row.get('conditions', '{}'),
+            row['model_orientation']
+        )
+
 def setup_database():
     """Create tables and load sample data into SQLite"""
 
-    conn = sqlite3.connect(DB_PATH)
+    # Autocommit mode: transactions are opened explicitly with BEGIN below
+    conn = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
+    apply_bulk_load_pragmas(conn)
     cursor = conn.cursor()
 
     # Create policies table
@@ -24,57 +73,41 @@ def setup_database():
             severity_default TEXT CHECK (severity_default IN ('low','medium','high','critical')) NOT NULL
         )
     """)
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_policies_text ON policies(policy_text)")
 
     # Create playbook_rules table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS playbook_rules (
             rule_id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
             rule_text TEXT NOT NULL,
-            applicable_contract_types TEXT,  -- JSON array as text
-            applicable_clauses TEXT,  -- JSON array as text
+            applicable_contract_types TEXT CHECK (json_valid(applicable_contract_types)),  -- JSON array
+            applicable_clauses TEXT CHECK (json_valid(applicable_clauses)),  -- JSON array
             severity_override TEXT CHECK (severity_override IN ('low','medium','high','critical')),
             conditions TEXT,  -- JSON object as text
             model_orientation TEXT CHECK (model_orientation IN ('buy','sell')) NOT NULL
         )
     """)
 
-    # Load policies from CSV
-    with open('policies_light.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO policies (policy_text, policy_category, severity_default)
-                VALUES (?, ?, ?)
-            """, (
-                row['policy_text'],
-                row.get('policy_category'),
-                row.get('severity_default', 'medium')
-            ))
-
-    # Load playbook rules from CSV
-    with open('playbook_rules_light.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Convert semicolon-separated lists to JSON arrays
-            contract_types = json.dumps([x.strip() for x in row.get('applicable_contract_types', '').split(';') if x.strip()])
-            clauses = json.dumps([x.strip() for x in row.get('applicable_clauses', '').split(';') if x.strip()])
-
-            cursor.execute("""
-                INSERT INTO playbook_rules (
-                    rule_text, applicable_contract_types, applicable_clauses,
-                    severity_override, conditions, model_orientation
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                row['rule_text'],
-                contract_types,
-                clauses,
-                row.get('severity_override') or None,
-                row.get('conditions', '{}'),
-                row['model_orientation']
-            ))
-
-    conn.commit()
+    # Load both CSVs in one transaction; the row generators stream straight
+    # into executemany without building intermediate lists
+    with conn, \
+            open('policies_light.csv', 'r', encoding='utf-8') as policies_file, \
+            open('playbook_rules_light.csv', 'r', encoding='utf-8') as rules_file:
+        cursor.execute("BEGIN")
+        # OR IGNORE so re-running against an existing database skips policies
+        # already present instead of failing on ix_policies_text
+        cursor.executemany("""
+            INSERT OR IGNORE INTO policies (policy_text, policy_category, severity_default)
+            VALUES (?, ?, ?)
+        """, _policy_rows(csv.DictReader(policies_file)))
+
+        cursor.executemany("""
+            INSERT INTO playbook_rules (
+                rule_text, applicable_contract_types, applicable_clauses,
+                severity_override, conditions, model_orientation
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, _rule_rows(csv.DictReader(rules_file)))
 
     # Verify data loaded
     cursor.execute("SELECT COUNT(*) FROM policies")
@@ -8,14 +8,36 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 from dotenv import load_dotenv
 import json
+import hashlib
+from collections import Counter
+from functools import lru_cache
 
 # Document parsing libraries
-import pdfplumber
 from docx import Document as DocxDocument
 
+try:
+    import orjson  # C JSON parser - LLM responses can be 100KB+
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+try:
+    import uvloop  # libuv event loop - cheaper awaits/socket I/O for many concurrent LLM calls
+except ImportError:  # pragma: no cover - optional dependency (unavailable on Windows)
+    uvloop = None
+
 # LangChain for LLM-based extraction
 from langchain_anthropic import ChatAnthropic
 from langchain.prompts import ChatPromptTemplate
@@ -24,8 +46,10 @@ from langchain.prompts import ChatPromptTemplate
 load_dotenv()
 
 # Import existing workflow and policy loader
+from pdf_extraction import extract_pdf_pages
 from src.agents.workflow import ContractAnalysisWorkflow
 from get_policies import get_policies_for_contract
+from src.utils.text import count_words
 from config.settings import settings
 
 
@@ -33,26 +57,20 @@ from config.settings import settings
 # DOCUMENT PARSERS
 # =============================================================================
 
-def parse_pdf(file_path: str) -> str:
+def parse_pdf(file_path: str) -> Iterator[str]:
     """
-    Extract text from PDF file
+    Extract text from PDF file one page at a time
+
+    Uses PyMuPDF or PDFium when installed and falls back to pdfplumber when
+    neither is available or they find no text (e.g. scanned or unusually encoded PDFs).
 
     Args:
         file_path: Path to PDF file
 
-    Returns:
-        Extracted text content
+    Yields:
+        Text content of each non-empty page, in page order
     """
-    text_parts = []
-
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-
-    full_text = "\n\n".join(text_parts)
-    return full_text
+    yield from extract_pdf_pages(file_path)
 
 
 def parse_docx(file_path: str) -> str:
@@ -67,13 +85,47 @@ def parse_docx(file_path: str) -> str:
     """
     doc = DocxDocument(file_path)
 
-    text_parts = []
-    for paragraph in doc.paragraphs:
-        if paragraph.text.strip():
-            text_parts.append(paragraph.text)
+    # Paragraph.text re-walks the paragraph's XML runs, so read it once
+    paragraph_texts = (paragraph.text for paragraph in doc.paragraphs)
+    return "\n\n".join(text for text in paragraph_texts if text.strip())
+
 
-    full_text = "\n\n".join(text_parts)
-    return full_text
+# Extracted text is cached so re-analyzing an unchanged file skips parsing
+TEXT_CACHE_DIR = Path.home() / ".cache" / "legal_assistant" / "text"
+
+
+def _text_cache_path(file_path: Path) -> Path:
+    """Cache file keyed by path, mtime and size - any edit to the file misses"""
+    stat = file_path.stat()
+    key = hashlib.sha1(
+        f"{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')
+    ).hexdigest()
+    suffix = ".txt.zst" if zstandard is not None else ".txt"
+    return TEXT_CACHE_DIR / f"{key}{suffix}"
+
+
+def _read_text_cache(cache_path: Path) -> Optional[str]:
+    try:
+        data = cache_path.read_bytes()
+        if zstandard is not None:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode('utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+    except Exception as e:  # zstandard.ZstdError on a corrupt entry
+        print(f"⚠️  Ignoring unreadable text cache entry: {e}")
+        return None
+
+
+def _write_text_cache(cache_path: Path, text: str) -> None:
+    try:
+        data = text.encode('utf-8')
+        if zstandard is not None:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(data)
+    except OSError as e:
+        print(f"⚠️  Could not write text cache: {e}")
 
 
 def parse_document(file_path: str) -> str:
@@ -96,42 +148,77 @@ def parse_document(file_path: str) -> str:
 
     extension = file_path.suffix.lower()
 
-    if extension == '.pdf':
-        return parse_pdf(str(file_path))
-    elif extension in ['.docx', '.doc']:
-        return parse_docx(str(file_path))
-    elif extension == '.txt':
+    if extension == '.txt':
         return file_path.read_text(encoding='utf-8')
-    else:
+    if extension not in ['.pdf', '.docx', '.doc']:
         raise ValueError(f"Unsupported file type: {extension}. Supported: .pdf, .docx, .txt")
 
+    cache_path = _text_cache_path(file_path)
+    cached = _read_text_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    if extension == '.pdf':
+        text = "\n\n".join(parse_pdf(str(file_path)))
+    else:
+        text = parse_docx(str(file_path))
+
+    _write_text_cache(cache_path, text)
+    return text
+
 
 # =============================================================================
 # LLM-BASED CLAUSE EXTRACTION
 # =============================================================================
 
-async def extract_clauses_with_llm(contract_text: str, contract_type: str = 'saas') -> List[Dict]:
+EXTRACTION_MODEL = "claude-3-5-haiku-20241022"
+
+# Common LLM variants mapped onto the clause types used by policies and
+# playbook rules. Only spellings that are not themselves a policy category or
+# applicable_clauses value belong here; anything unmapped passes through.
+CLAUSE_TYPE_SYNONYMS = {
+    'sla': 'service_levels',
+    'service_level': 'service_levels',
+    'service_level_agreement': 'service_levels',
+    'uptime': 'service_levels',
+    'liability': 'limitation_of_liability',
+    'liability_cap': 'limitation_of_liability',
+    'limitation_of_liabilities': 'limitation_of_liability',
+    'data_privacy': 'data_protection',
+    'privacy': 'data_protection',
+    'gdpr': 'data_protection',
+    'dpa': 'data_protection',
+    'jurisdiction': 'governing_law',
+    'indemnification': 'indemnity',
+    'payment': 'payment_terms',
+    'term_and_termination': 'termination',
+    'nda': 'confidentiality',
+    'ip': 'intellectual_property',
+    'ip_ownership': 'intellectual_property',
+    'warranties': 'warranty',
+    'audit': 'audit_rights',
+    'renewal': 'automatic_renewal',
+    'auto_renewal': 'automatic_renewal',
+}
+
+
+def normalize_clause_type(clause_type: Optional[str]) -> str:
+    """Map an LLM-provided clause type onto its canonical spelling
+
+    This is a synonym mapping, not a whitelist: policy categories and
+    playbook applicable_clauses live in the database, so unknown types are
+    kept as-is (slugified) and can still match them. A missing type
+    becomes "other".
     """
-    Use Claude to intelligently extract and classify contract clauses
+    if not clause_type:
+        return 'other'
+    normalized = clause_type.strip().lower().replace(' ', '_').replace('-', '_')
+    return CLAUSE_TYPE_SYNONYMS.get(normalized, normalized) or 'other'
 
-    Args:
-        contract_text: Full contract text
-        contract_type: Type of contract (saas, professional_services, etc.)
-
-    Returns:
-        List of extracted clauses with classification
-    """
-    # Use Haiku for fast extraction
-    llm = ChatAnthropic(
-        model="claude-3-5-haiku-20241022",
-        max_tokens=4096,
-        temperature=0.1,
-        timeout=60,  # 60 second timeout for extraction
-        anthropic_api_key=settings.ANTHROPIC_API_KEY
-    )
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a legal document parser specialized in contract analysis.
+# Built once at import; formatting per call is cheap
+EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a legal document parser specialized in contract analysis.
 
 Your task: Extract all distinct clauses from the contract and classify them.
 
@@ -169,38 +256,196 @@ Rules:
 4. Classify using the types listed above
 5. If uncertain about type, use "other" and note in clause_type_note field
 6. Include section numbers/identifiers if present"""),
-        ("user", """Contract Type: {contract_type}
+    ("user", """Contract Type: {contract_type}
 
 Contract Text:
 {contract_text}
 
 Extract all clauses and return JSON array:""")
-    ])
+])
+
 
+@lru_cache(maxsize=None)
+def _get_extraction_llm(model: str = EXTRACTION_MODEL, max_tokens: int = 4096) -> ChatAnthropic:
+    """Shared extraction client so its HTTP connection pool stays warm across calls"""
+    return ChatAnthropic(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=0.1,
+        timeout=60,  # 60 second timeout for extraction
+        anthropic_api_key=settings.ANTHROPIC_API_KEY
+    )
+
+
+async def _warm_extraction_llm() -> None:
+    """
+    Build the shared extraction client ahead of the first call
+
+    Only constructs the client (SDK imports, HTTP client setup) - no request
+    is sent, so nothing is billed when the clause cache serves every chunk.
+    Best effort only - any failure here surfaces later in the real request.
+    """
     try:
-        # Truncate very long contracts (Claude has token limits)
-        max_chars = 50000  # ~12k tokens
-        if len(contract_text) > max_chars:
-            print(f"⚠️  Contract is large ({len(contract_text)} chars), truncating to {max_chars} chars for extraction")
-            contract_text = contract_text[:max_chars] + "\n\n[... document truncated ...]"
-
-        # Invoke Claude
-        response = await llm.ainvoke(
-            prompt.format(
-                contract_type=contract_type,
-                contract_text=contract_text
-            )
-        )
+        await asyncio.to_thread(_get_extraction_llm)
+    except Exception as e:
+        print(f"⚠️  Extraction client warm-up failed: {e!r}")
+
 
-        # Parse response
-        content = response.content.strip()
+# Contracts are split on paragraph boundaries into windows small enough that
+# several extraction calls run at once; per-call latency dominates, so more
+# smaller windows finish sooner than one large request
+MAX_CHUNK_CHARS = int(os.getenv("EXTRACTION_CHUNK_CHARS", "12000"))  # ~3k tokens
+MAX_CONCURRENT_EXTRACTIONS = int(os.getenv("EXTRACTION_CONCURRENCY", "8"))  # Anthropic tier limit
+CHUNK_TIMEOUT_SECONDS = 90
 
-        # Remove markdown code blocks if present
-        if content.startswith('```'):
-            content = content.split('\n', 1)[1]  # Remove first line
-            content = content.rsplit('\n```', 1)[0]  # Remove last line
+# Extracted clauses keyed by contract content, so re-analyzing the same
+# contract skips the LLM round-trip entirely
+CLAUSE_CACHE_DIR = Path.home() / ".cache" / "legal_assistant" / "clauses"
 
-        clauses_raw = json.loads(content)
+
+def _json_loads(data):
+    """Parse JSON with orjson when available (its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _clause_cache_path(contract_text: str, contract_type: str) -> Path:
+    """Cache file for a contract's extracted clauses"""
+    payload = f"{EXTRACTION_MODEL}\x00{contract_type}\x00{contract_text}"
+    if xxhash is not None:
+        key = xxhash.xxh128_hexdigest(payload)
+    else:
+        key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return CLAUSE_CACHE_DIR / f"{key}.json"
+
+
+def _read_clause_cache(cache_path: Path) -> Optional[List[Dict]]:
+    try:
+        return _json_loads(cache_path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_clause_cache(cache_path: Path, clauses: List[Dict]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(clauses))
+        else:
+            cache_path.write_text(json.dumps(clauses), encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️  Could not write clause cache: {e}")
+
+
+def _chunk_contract(contract_text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
+    """Split contract text into chunks of at most max_chars on paragraph boundaries"""
+    chunks = []
+    current = []
+    current_size = 0  # Length of '\n\n'.join(current)
+
+    for paragraph in contract_text.split('\n\n'):
+        # A single oversized paragraph is hard-split as a last resort
+        while len(paragraph) > max_chars:
+            if current:
+                chunks.append('\n\n'.join(current))
+                current, current_size = [], 0
+            chunks.append(paragraph[:max_chars])
+            paragraph = paragraph[max_chars:]
+        if not paragraph:
+            continue
+
+        if current and current_size + 2 + len(paragraph) > max_chars:
+            chunks.append('\n\n'.join(current))
+            current, current_size = [], 0
+
+        current_size += len(paragraph) + (2 if current else 0)
+        current.append(paragraph)
+
+    if current:
+        chunks.append('\n\n'.join(current))
+
+    return chunks
+
+
+async def extract_clauses_with_llm(contract_text: str, contract_type: str = 'saas') -> List[Dict]:
+    """
+    Use Claude to intelligently extract and classify contract clauses
+
+    Args:
+        contract_text: Full contract text
+        contract_type: Type of contract (saas, professional_services, etc.)
+
+    Returns:
+        List of extracted clauses with classification
+    """
+    cache_path = _clause_cache_path(contract_text, contract_type)
+    cached = await asyncio.to_thread(_read_clause_cache, cache_path)
+    if cached is not None:
+        print(f"✅ Loaded {len(cached)} clauses from cache")
+        return cached
+
+    llm = _get_extraction_llm()
+    prompt = EXTRACTION_PROMPT
+
+    try:
+        chunks = _chunk_contract(contract_text)
+        if len(chunks) > 1:
+            print(f"📑 Extracting {len(chunks)} chunks in parallel "
+                  f"({len(contract_text):,} chars, up to {MAX_CONCURRENT_EXTRACTIONS} at a time)")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+
+        async def extract_chunk(chunk: str) -> List[Dict]:
+            async with semaphore:
+                # Invoke Claude
+                response = await asyncio.wait_for(
+                    llm.ainvoke(
+                        prompt.format(
+                            contract_type=contract_type,
+                            contract_text=chunk
+                        )
+                    ),
+                    timeout=CHUNK_TIMEOUT_SECONDS
+                )
+
+            # Parse response
+            content = response.content.strip()
+
+            # Remove markdown code blocks if present - slice by index rather
+            # than split/rsplit so a large response is copied only once
+            if content.startswith('```'):
+                nl = content.find('\n')
+                end = content.rfind('\n```')
+                if nl == -1:
+                    content = ''
+                else:
+                    content = content[nl + 1:end] if end > nl else content[nl + 1:]
+
+            try:
+                return _json_loads(content)
+            except json.JSONDecodeError as e:
+                print(f"❌ Error parsing LLM response: {e}")
+                print(f"Response was: {content[:200]}...")
+                raise
+
+        results = await asyncio.gather(
+            *(extract_chunk(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+
+        clauses_raw = []
+        failed_chunks = 0
+        for result in results:
+            if isinstance(result, Exception):
+                failed_chunks += 1
+                if not isinstance(result, json.JSONDecodeError):
+                    print(f"❌ Error extracting clauses: {result!r}")
+                continue
+            clauses_raw.extend(result)
+
+        if failed_chunks:
+            print(f"⚠️  {failed_chunks} of {len(chunks)} chunks failed extraction")
 
         # Add unique IDs and normalize
         clauses = []
@@ -208,18 +453,18 @@ Extract all clauses and return JSON array:""")
             clauses.append({
                 'clause_id': f"clause-{i}",
                 'clause_identifier': clause.get('clause_identifier', f'Clause {i}'),
-                'clause_type': clause.get('clause_type', 'other'),
+                'clause_type': normalize_clause_type(clause.get('clause_type')),
                 'clause_text': clause.get('clause_text', ''),
                 'extraction_confidence': clause.get('confidence', 0.8)
             })
 
         print(f"✅ Extracted {len(clauses)} clauses using LLM")
-        return clauses
 
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing LLM response: {e}")
-        print(f"Response was: {content[:200]}...")
-        return []
+        # Don't cache partial results from failed chunks
+        if clauses and not failed_chunks:
+            await asyncio.to_thread(_write_clause_cache, cache_path, clauses)
+
+        return clauses
 
     except Exception as e:
         print(f"❌ Error extracting clauses: {e}")
@@ -256,13 +501,24 @@ async def analyze_contract_file(
     print(f"🔄 Orientation: {model_orientation}")
     print()
 
+    # Policies don't depend on the document, so load them while it's parsed
+    policies_task = asyncio.create_task(asyncio.to_thread(
+        get_policies_for_contract,
+        contract_type=contract_type,
+        model_orientation=model_orientation
+    ))
+
     # Step 1: Parse document
     print("🔍 STEP 1: Parsing Document")
     print("-" * 100)
 
     try:
-        contract_text = parse_document(file_path)
-        word_count = len(contract_text.split())
+        # Parse in a worker thread while the extraction client is built
+        contract_text, _ = await asyncio.gather(
+            asyncio.to_thread(parse_document, file_path),
+            _warm_extraction_llm()
+        )
+        word_count = count_words(contract_text)
         char_count = len(contract_text)
 
         print(f"✅ Extracted {word_count:,} words ({char_count:,} characters)")
@@ -271,6 +527,7 @@ async def analyze_contract_file(
 
     except Exception as e:
         print(f"❌ Error parsing document: {e}")
+        policies_task.cancel()
         return {'error': str(e), 'stage': 'parsing'}
 
     # Step 2: Extract clauses with LLM
@@ -281,6 +538,7 @@ async def analyze_contract_file(
 
     if not clauses:
         print("❌ No clauses extracted. Cannot continue.")
+        policies_task.cancel()
         return {'error': 'No clauses extracted', 'stage': 'extraction'}
 
     print(f"\nExtracted {len(clauses)} clauses:")
@@ -295,10 +553,7 @@ async def analyze_contract_file(
     print("📚 STEP 3: Loading Policies from Database")
     print("-" * 100)
 
-    policies = get_policies_for_contract(
-        contract_type=contract_type,
-        model_orientation=model_orientation
-    )
+    policies = await policies_task
 
     print(f"✅ Loaded {len(policies)} applicable policies")
     print()
@@ -362,10 +617,7 @@ def print_analysis_results(result: Dict):
     print(f"\n📊 Summary Statistics:")
     print(f"  - Total Findings: {len(findings)}")
 
-    severity_counts = {}
-    for finding in findings:
-        sev = finding.get('severity', 'unknown').upper()
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    severity_counts = Counter((finding.get('severity') or 'unknown').upper() for finding in findings)
 
     for sev in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
         if sev in severity_counts:
@@ -381,10 +633,11 @@ def print_analysis_results(result: Dict):
     print("-" * 100)
 
     for i, finding in enumerate(findings, 1):
-        severity = finding.get('severity', 'unknown').upper()
-        deviation = finding.get('deviation_type', 'unknown')
-        evidence = finding.get('evidence_quote', 'N/A')[:80]
-        explanation = finding.get('explanation', 'N/A')
+        get = finding.get
+        severity = get('severity', 'unknown').upper()
+        deviation = get('deviation_type', 'unknown')
+        evidence = get('evidence_quote', 'N/A')[:80]
+        explanation = get('explanation', 'N/A')
 
         print(f"\n{i}. [{severity}] {deviation.replace('_', ' ').title()}")
         print(f"   Evidence: \"{evidence}...\"")
@@ -396,10 +649,11 @@ def print_analysis_results(result: Dict):
         print("-" * 100)
 
         for i, edit in enumerate(suggested_edits, 1):
-            edit_type = edit.get('edit_type', 'unknown')
-            summary = edit.get('change_summary', 'N/A')
-            status = edit.get('status', 'pending').upper()
-            conflicts = len(edit.get('conflicts_with', []))
+            get = edit.get
+            edit_type = get('edit_type', 'unknown')
+            summary = get('change_summary', 'N/A')
+            status = get('status', 'pending').upper()
+            conflicts = len(get('conflicts_with', []))
 
             print(f"\n{i}. {summary}")
             print(f"   Type: {edit_type} | Status: {status}")
@@ -452,4 +706,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
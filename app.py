@@ -5,11 +5,25 @@ Drag-and-drop interface for evaluating legal output
 
 import streamlit as st
 import asyncio
-from pathlib import Path
+import concurrent.futures
 from datetime import datetime
-from collections import defaultdict
-import tempfile
+from collections import Counter
 import os
+import json
+import hashlib
+import queue
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import uvloop  # libuv event loop - cheaper awaits/socket I/O for many concurrent LLM calls
+except ImportError:  # pragma: no cover - optional dependency (unavailable on Windows)
+    uvloop = None
 
 # Set API key from Streamlit secrets before importing other modules
 if "ANTHROPIC_API_KEY" in st.secrets:
@@ -20,8 +34,20 @@ elif not os.getenv("ANTHROPIC_API_KEY"):
 
 # Import analysis functions
 from quick_analyze import extract_clauses_simple
+from src.utils.text import count_words
+from file_parsing import parse_file_bytes
 from get_policies import get_policies_for_contract
 from src.orchestration import AdaptiveOrchestrator
+from config.settings import settings
+from src.services.llm_cache import llm_retries
+
+
+def results_to_json(result) -> bytes:
+    """Serialize analysis results for download (values orjson can't encode become strings)"""
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(result, default=str, indent=2).encode('utf-8')
+
 
 # Page config
 st.set_page_config(
@@ -30,8 +56,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Static markup, defined once rather than rebuilt inside main() on each rerun
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -49,8 +75,38 @@ st.markdown("""
     .high { color: #ff7f0e; font-weight: bold; }
     .medium { color: #ffbb78; font-weight: bold; }
     .low { color: #98df8a; font-weight: bold; }
-</style>
-""", unsafe_allow_html=True)
+</style>
+"""
+
+_HEADER_HTML = '<p class="main-header">⚖️ Legal Contract Analyzer</p>'
+
+_ABOUT_MD = """
+This tool uses a 4-agent AI pipeline to:
+1. Extract contract clauses
+2. Check against policies
+3. Generate rationales
+4. Suggest edits
+
+**Current Database:**
+- 25 policies
+- 16 playbook rules
+"""
+
+_GET_STARTED_MD = """
+1. **Upload a contract** using the file uploader above
+2. **Configure settings** in the sidebar (contract type, orientation, style)
+3. **Click "Analyze Contract"** to run the analysis
+4. **Review findings** and suggested edits
+
+---
+
+**Sample Files:**
+- Try the included `sample_contract.txt` to see how it works
+- Supports PDF, DOCX, and TXT formats
+"""
+
+# Custom CSS
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Initialize session-level orchestration state for negotiation tracking
 if "project_id" not in st.session_state:
@@ -64,76 +120,122 @@ if "orchestrator" not in st.session_state:
 def parse_uploaded_file(uploaded_file):
     """Parse uploaded file to text"""
 
-    # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp:
-        tmp.write(uploaded_file.getvalue())
-        tmp_path = tmp.name
+    # Parse straight from the upload's bytes - no temp file round-trip
+    return _parse_file_bytes(uploaded_file.name, uploaded_file.getvalue())
 
-    try:
-        # Determine file type and parse
-        extension = Path(uploaded_file.name).suffix.lower()
-
-        if extension == '.txt':
-            text = Path(tmp_path).read_text(encoding='utf-8')
-        elif extension == '.pdf':
-            import pdfplumber
-            text_parts = []
-            with pdfplumber.open(tmp_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-            text = "\n\n".join(text_parts)
-        elif extension in ['.docx', '.doc']:
-            from docx import Document as DocxDocument
-            doc = DocxDocument(tmp_path)
-            text_parts = [p.text for p in doc.paragraphs if p.text.strip()]
-            text = "\n\n".join(text_parts)
-        else:
-            return None, f"Unsupported file type: {extension}"
-
-        return text, None
 
-    except Exception as e:
-        return None, f"Error parsing file: {str(e)}"
+@st.cache_data(max_entries=16, show_spinner=False)
+def _parse_file_bytes(file_name, data):
+    """Cached on the file's bytes, so re-running analysis on the same upload skips parsing"""
+    return parse_file_bytes(file_name, data)
 
-    finally:
-        # Clean up temp file
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_policies(contract_type, orientation):
+    """Policies for a contract type/orientation, shared across reruns and sessions"""
+    return get_policies_for_contract(
+        contract_type=contract_type,
+        model_orientation=orientation
+    )
+
+
+# How often the script thread checks on a running analysis
+ANALYSIS_POLL_SECONDS = 0.25
+
+
+@st.cache_resource
+def get_analysis_loop():
+    """Event loop shared by all sessions, running in a daemon thread"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="analysis-loop", daemon=True).start()
+    return loop
+
+
+def render_updates(updates, container):
+    """Write queued (method, message) updates from the analysis loop into a container"""
+    while True:
+        try:
+            method, message = updates.get_nowait()
+        except queue.Empty:
+            return
+        getattr(container, method)(message)
+
+
+def submit_analysis(coro):
+    """Start a coroutine on the analysis loop, cancelling this session's previous run
+
+    The future is kept in session_state so a run orphaned by a stop or rerun
+    (before wait_for_analysis could cancel it) is cancelled on the next submit.
+    """
+    previous = st.session_state.pop("analysis_future", None)
+    if previous is not None:
+        previous.cancel()
+    future = asyncio.run_coroutine_threadsafe(coro, get_analysis_loop())
+    st.session_state["analysis_future"] = future
+    return future
+
+
+def wait_for_analysis(future, updates, container):
+    """Poll a submitted analysis, rendering its queued updates, and return its result
+
+    Stopping or rerunning the script raises out of the polling loop; the run
+    is cancelled then rather than left working (and billing) in the background.
+    """
+    try:
+        while not future.done():
+            render_updates(updates, container)
+            time.sleep(ANALYSIS_POLL_SECONDS)
+        render_updates(updates, container)
+        return future.result()
+    finally:
+        if not future.done():
+            future.cancel()
+        st.session_state.pop("analysis_future", None)
+
+
+def analysis_cache_key(contract_text, contract_type, orientation, style_params):
+    """Identify an analysis by the contract's content and the settings it ran with"""
+    digest = hashlib.blake2b(contract_text.encode('utf-8'), digest_size=16)
+    digest.update(json.dumps([contract_type, orientation, style_params], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+async def analyze_contract_async(contract_text, policies_future, style_params, max_llm_concurrency, project_id, session_id, orchestrator, updates):
+    """
+    Run async analysis
+
+    Runs on the background analysis loop, where Streamlit calls are unavailable,
+    so progress is posted to the `updates` queue for the script thread to render.
+    `policies_future` is resolved by the script thread, which loads the policies
+    (through st.cache_data) while clauses are extracted here.
+    """
 
-async def analyze_contract_async(contract_text, contract_type, orientation, style_params, project_id, session_id, orchestrator):
-    """Run async analysis"""
+    # Count this run's rate-limit/timeout retries across all agent calls
+    retries = []
+    llm_retries.set(retries)
 
     try:
-        # Extract clauses
-        clauses = extract_clauses_simple(contract_text)
+        # Extract clauses in a worker thread while the policies load
+        clauses, policies = await asyncio.gather(
+            asyncio.to_thread(extract_clauses_simple, contract_text),
+            asyncio.wrap_future(policies_future),
+        )
 
         if not clauses:
             return None, "❌ No clauses could be extracted from the contract. Please check that your document has clear section headers (e.g., '1.', 'Section 1:', 'PAYMENT TERMS')."
 
         # Debug: Log clause extraction with type breakdown
-        clause_types = {}
-        for c in clauses:
-            ctype = c.get('clause_type', 'unknown')
-            clause_types[ctype] = clause_types.get(ctype, 0) + 1
+        clause_types = Counter(c.get('clause_type', 'unknown') for c in clauses)
 
         clause_type_summary = ", ".join([f"{k}: {v}" for k, v in sorted(clause_types.items())])
-        st.info(f"✅ Extracted {len(clauses)} clauses from contract")
-        st.info(f"📋 Clause types: {clause_type_summary}")
-
-        # Load policies
-        policies = get_policies_for_contract(
-            contract_type=contract_type,
-            model_orientation=orientation
-        )
+        updates.put(("info", f"✅ Extracted {len(clauses)} clauses from contract"))
+        updates.put(("info", f"📋 Clause types: {clause_type_summary}"))
 
         if not policies:
             return None, "❌ No policies found for this contract type and orientation."
 
         # Debug: Log policy loading
-        st.info(f"✅ Loaded {len(policies)} policies for checking")
+        updates.put(("info", f"✅ Loaded {len(policies)} policies for checking"))
 
         version_id = f"{session_id}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         preference_payload = {
@@ -149,9 +251,24 @@ async def analyze_contract_async(contract_text, contract_type, orientation, styl
             policies=policies,
             preferences=preference_payload if preference_payload else None,
             style_params=style_params,
+            max_llm_concurrency=max_llm_concurrency,
         )
 
-        await orchestrator.run(max_iterations=50)
+        # Report each agent as it finishes instead of blocking until the end
+        async for progress in orchestrator.run_streaming(max_iterations=50):
+            if progress.error:
+                updates.put(("write", f"⚠️ {progress.agent_name or progress.task_type}: {progress.error}"))
+                continue
+            context = progress.context or {}
+            updates.put((
+                "write",
+                f"✅ {progress.agent_name}: {len(context.get('findings', []))} findings, "
+                f"{len(context.get('suggested_edits', []))} edits so far",
+            ))
+
+        if retries:
+            updates.put(("write", f"🔁 {len(retries)} LLM call retries after rate limits/timeouts"))
+
         result = orchestrator.build_result(context_id)
 
         if not result:
@@ -160,13 +277,13 @@ async def analyze_contract_async(contract_text, contract_type, orientation, styl
         # Debug: Log result summary
         findings_count = len(result.get('findings', []))
         errors_count = len(result.get('errors', []))
-        st.info(f"✅ Analysis complete: {findings_count} findings, {errors_count} errors")
+        updates.put(("info", f"✅ Analysis complete: {findings_count} findings, {errors_count} errors"))
 
         # Show errors if any
         if errors_count > 0:
-            st.warning(f"⚠️ {errors_count} errors occurred during analysis:")
+            updates.put(("warning", f"⚠️ {errors_count} errors occurred during analysis:"))
             for error in result.get('errors', []):
-                st.error(error)
+                updates.put(("error", error))
 
         return result, None
 
@@ -187,11 +304,8 @@ def display_results(result):
 
     col1, col2, col3, col4 = st.columns(4)
 
-    severity_counts = {'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
-    for f in findings:
-        sev = f.get('severity', 'UNKNOWN').upper()
-        if sev in severity_counts:
-            severity_counts[sev] += 1
+    # Counter returns 0 for severities with no findings
+    severity_counts = Counter((f.get('severity') or 'UNKNOWN').upper() for f in findings)
 
     with col1:
         st.markdown('<div class="stat-box">', unsafe_allow_html=True)
@@ -218,17 +332,21 @@ def display_results(result):
     st.markdown("### 🔍 Detailed Findings")
 
     for i, finding in enumerate(findings, 1):
-        sev = finding.get('severity', 'unknown').upper()
-        dev_type = finding.get('deviation_type', 'unknown').replace('_', ' ').title()
-        evidence = finding.get('evidence_quote', 'N/A')[:150]
-        explanation = finding.get('explanation', 'N/A')
+        get = finding.get
+        sev = get('severity', 'unknown').upper()
+        dev_type = get('deviation_type', 'unknown').replace('_', ' ').title()
+        evidence = get('evidence_quote', 'N/A')[:150]
+        explanation = get('explanation', 'N/A')
 
         # Color-code severity
         sev_class = sev.lower()
 
         with st.expander(f"**{i}. [{sev}] {dev_type}**", expanded=(i <= 3)):
-            st.markdown(f'<p class="{sev_class}">Severity: {sev}</p>', unsafe_allow_html=True)
-            st.markdown(f"**Evidence:**")
+            # Severity and evidence label share one markdown element
+            st.markdown(
+                f'<p class="{sev_class}">Severity: {sev}</p>\n\n**Evidence:**',
+                unsafe_allow_html=True
+            )
             st.info(f'"{evidence}..."')
             st.markdown(f"**Issue:** {explanation}")
 
@@ -238,10 +356,11 @@ def display_results(result):
         st.markdown("### ✏️ Suggested Changes")
 
         for i, edit in enumerate(suggested_edits, 1):
-            summary = edit.get('change_summary', 'N/A')
-            explanation = edit.get('explanation', 'N/A')
-            edit_type = edit.get('edit_type', 'unknown')
-            conflicts = len(edit.get('conflicts_with', []))
+            get = edit.get
+            summary = get('change_summary', 'N/A')
+            explanation = get('explanation', 'N/A')
+            edit_type = get('edit_type', 'unknown')
+            conflicts = len(get('conflicts_with', []))
 
             with st.expander(f"**{i}. {summary}**", expanded=(i <= 2)):
                 st.markdown(f"**Type:** `{edit_type}`")
@@ -249,22 +368,47 @@ def display_results(result):
                 if conflicts > 0:
                     st.warning(f"⚠️ Conflicts with {conflicts} other edit(s)")
 
-                st.markdown(f"**Recommendation:**")
-                st.write(explanation)
+                # Recommendation, deletions and insertions in one markdown element
+                parts = ["**Recommendation:**", str(explanation)]
 
-                # Show deletions and insertions
-                deletions = edit.get('deletions', [])
-                insertions = edit.get('insertions', [])
+                deletions = get('deletions', [])
+                insertions = get('insertions', [])
 
                 if deletions:
-                    st.markdown("**Deletions:**")
-                    for d in deletions:
-                        st.markdown(f'- ~~{d.get("deleted_text", "")}~~')
+                    parts.append("**Deletions:**")
+                    parts.append("\n".join(f'- ~~{d.get("deleted_text", "")}~~' for d in deletions))
 
-                if insertions:
-                    st.markdown("**Insertions:**")
-                    for ins in insertions:
-                        st.markdown(f'- **{ins.get("inserted_text", "")}**')
+                if insertions:
+                    parts.append("**Insertions:**")
+                    parts.append("\n".join(f'- **{ins.get("inserted_text", "")}**' for ins in insertions))
+
+                st.markdown("\n\n".join(parts))
+
+
+def export_json(analysis_key, result):
+    """JSON export of a result, serialized once per analysis"""
+    cached = st.session_state.get("last_export")
+    if cached and cached[0] == analysis_key:
+        return cached[1]
+
+    data = results_to_json(result)
+    st.session_state["last_export"] = (analysis_key, data)
+    return data
+
+
+def show_analysis(result, analysis_key):
+    """Display a finished analysis with the negotiation history and download button"""
+    display_results(result)
+    display_negotiation_history(st.session_state["orchestrator"], st.session_state["project_id"])
+
+    # Download results - reruns reuse the serialized JSON
+    st.markdown("---")
+    st.download_button(
+        label="📥 Download Results (JSON)",
+        data=export_json(analysis_key, result),
+        file_name=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
 
 
 def display_negotiation_history(orchestrator, project_id: str) -> None:
@@ -278,9 +422,7 @@ def display_negotiation_history(orchestrator, project_id: str) -> None:
         st.info("Upload additional revisions to build the negotiation timeline.")
         return
 
-    events_by_version = defaultdict(list)
-    for event in orchestrator.memory.get_agent_events(project_id):
-        events_by_version[event.get('version_id', '')].append(event)
+    events_by_version = orchestrator.memory.get_agent_events_grouped(project_id)
 
     with st.expander("View timeline", expanded=True):
         for idx, record in enumerate(reversed(history), start=1):
@@ -326,7 +468,7 @@ def main():
     """Main Streamlit app"""
 
     # Header
-    st.markdown('<p class="main-header">⚖️ Legal Contract Analyzer</p>', unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     st.markdown("Upload your contract to analyze it against your organization's legal policies")
 
     # Sidebar - Configuration
@@ -390,6 +532,14 @@ def main():
             'audience': audience
         }
 
+        max_llm_concurrency = st.number_input(
+            "Max Concurrent LLM Calls",
+            min_value=1,
+            max_value=32,
+            value=settings.LLM_MAX_CONCURRENCY,
+            help="Lower this if you hit your API tier's rate limits"
+        )
+
         st.markdown("### 🧭 Saved Preferences")
         if saved_prefs:
             for key, payload in sorted(saved_prefs.items()):
@@ -430,17 +580,7 @@ def main():
 
         st.markdown("---")
         st.markdown("### 📚 About")
-        st.info("""
-        This tool uses a 4-agent AI pipeline to:
-        1. Extract contract clauses
-        2. Check against policies
-        3. Generate rationales
-        4. Suggest edits
-
-        **Current Database:**
-        - 25 policies
-        - 16 playbook rules
-        """)
+        st.info(_ABOUT_MD)
 
     # Main area - File upload
     uploaded_file = st.file_uploader(
@@ -464,25 +604,50 @@ def main():
                 return
 
             # Show preview
-            word_count = len(contract_text.split())
+            word_count = count_words(contract_text)
             st.info(f"📝 Extracted {word_count:,} words ({len(contract_text):,} characters)")
 
             with st.expander("📄 Contract Preview (first 500 chars)"):
                 st.text(contract_text[:500] + "...")
 
-            # Run analysis
-            with st.spinner("🤖 Running adaptive multi-agent analysis..."):
-                result, error = asyncio.run(
-                    analyze_contract_async(
-                        contract_text,
-                        contract_type,
-                        orientation,
-                        style_params,
-                        project_id,
-                        session_id,
-                        orchestrator,
-                    )
-                )
+            analysis_key = analysis_cache_key(contract_text, contract_type, orientation, style_params)
+            last_analysis = st.session_state.get("last_analysis")
+
+            if last_analysis and last_analysis[0] == analysis_key:
+                # Same contract and settings as this session's last run - don't
+                # re-run the agents or record a duplicate version
+                result, error = last_analysis[1], None
+                st.info("♻️ Same contract and settings as the last analysis - showing its results")
+            else:
+                # Run analysis on the background loop, polling so the page keeps updating
+                policies_future = concurrent.futures.Future()
+                updates = queue.SimpleQueue()
+                with st.status("🤖 Running adaptive multi-agent analysis...", expanded=True) as status:
+                    future = submit_analysis(
+                        analyze_contract_async(
+                            contract_text,
+                            policies_future,
+                            style_params,
+                            max_llm_concurrency,
+                            project_id,
+                            session_id,
+                            orchestrator,
+                            updates,
+                        )
+                    )
+                    try:
+                        policies_future.set_result(load_policies(contract_type, orientation))
+                    except Exception as e:
+                        policies_future.set_exception(e)
+                    result, error = wait_for_analysis(future, updates, status)
+                    status.update(
+                        label="❌ Analysis failed" if error else "✅ Agents finished",
+                        state="error" if error else "complete",
+                        expanded=bool(error),
+                    )
+
+                if not error:
+                    st.session_state["last_analysis"] = (analysis_key, result)
 
             if error:
                 st.error(f"❌ {error}")
@@ -490,36 +655,26 @@ def main():
 
             # Display results
             st.success("✅ Analysis complete!")
-            display_results(result)
-            display_negotiation_history(st.session_state["orchestrator"], st.session_state["project_id"])
-
-            # Download results
-            st.markdown("---")
-            st.download_button(
-                label="📥 Download Results (JSON)",
-                data=str(result),
-                file_name=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
-
+            show_analysis(result, analysis_key)
+
+        else:
+            # Any widget change reruns the script - keep showing this upload's
+            # last analysis instead of making the user re-run the agents
+            last_analysis = st.session_state.get("last_analysis")
+            if last_analysis:
+                contract_text, error = parse_uploaded_file(uploaded_file)
+                if not error and last_analysis[0] == analysis_cache_key(
+                    contract_text, contract_type, orientation, style_params
+                ):
+                    show_analysis(last_analysis[1], last_analysis[0])
+
     else:
         # Show existing timeline (if any) even without active upload
         display_negotiation_history(orchestrator, project_id)
 
         # Show instructions
         st.markdown("### 👋 Get Started")
-        st.markdown("""
-        1. **Upload a contract** using the file uploader above
-        2. **Configure settings** in the sidebar (contract type, orientation, style)
-        3. **Click "Analyze Contract"** to run the analysis
-        4. **Review findings** and suggested edits
-
-        ---
-
-        **Sample Files:**
-        - Try the included `sample_contract.txt` to see how it works
-        - Supports PDF, DOCX, and TXT formats
-        """)
+        st.markdown(_GET_STARTED_MD)
 
 
 if __name__ == "__main__":
@@ -5,13 +5,25 @@ Simplified single-agent approach with better results
 
 import streamlit as st
 import asyncio
-from pathlib import Path
+import queue
+import threading
+import time
 from datetime import datetime
-import tempfile
 import os
 import json
+import hashlib
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import uvloop  # libuv event loop - cheaper awaits/socket I/O for many concurrent LLM calls
+except ImportError:  # pragma: no cover - optional dependency (unavailable on Windows)
+    uvloop = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -24,10 +36,19 @@ elif not os.getenv("OPENAI_API_KEY"):
     st.stop()
 
 # Import unified agent
-from src.agents.unified_agent import UnifiedContractAgent
+from src.agents.unified_agent import UnifiedContractAgent, create_unified_llm
 from get_policies import get_all_policies
+from file_parsing import parse_file_bytes
 from src.services.negotiation_tracker import NegotiationTracker
 
+
+def results_to_json(result) -> bytes:
+    """Serialize analysis results for download (values orjson can't encode become strings)"""
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(result, default=str, indent=2).encode('utf-8')
+
+
 # Page config
 st.set_page_config(
     page_title="Legal Contract Analyzer",
@@ -35,8 +56,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Static markup, defined once at module level
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -50,6 +71,17 @@ st.markdown("""
         border-radius: 0.5rem;
         text-align: center;
     }
+    .stat-grid {
+        display: grid;
+        grid-template-columns: repeat(5, 1fr);
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .risk-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+    }
     .critical { color: #d62728; font-weight: bold; }
     .high { color: #ff7f0e; font-weight: bold; }
     .medium { color: #ffbb78; font-weight: bold; }
@@ -80,92 +112,181 @@ st.markdown("""
         border-radius: 0.2rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Custom CSS
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def parse_uploaded_file(uploaded_file):
     """Parse uploaded file to text"""
 
-    # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp:
-        tmp.write(uploaded_file.getvalue())
-        tmp_path = tmp.name
+    # Parse straight from the upload's bytes - no temp file round-trip
+    return _parse_file_bytes(uploaded_file.name, uploaded_file.getvalue())
 
-    try:
-        # Determine file type and parse
-        extension = Path(uploaded_file.name).suffix.lower()
-
-        if extension == '.txt':
-            text = Path(tmp_path).read_text(encoding='utf-8')
-        elif extension == '.pdf':
-            import pdfplumber
-            text_parts = []
-            with pdfplumber.open(tmp_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-            text = "\n\n".join(text_parts)
-        elif extension in ['.docx', '.doc']:
-            from docx import Document as DocxDocument
-            doc = DocxDocument(tmp_path)
-            text_parts = [p.text for p in doc.paragraphs if p.text.strip()]
-            text = "\n\n".join(text_parts)
-        else:
-            return None, f"Unsupported file type: {extension}"
 
-        return text, None
+@st.cache_data(max_entries=16, show_spinner=False)
+def _parse_file_bytes(file_name, data):
+    """Cached on the file's bytes, so re-running analysis on the same upload skips parsing"""
+    return parse_file_bytes(file_name, data)
+
+
+# How often the script thread checks on a running analysis
+ANALYSIS_POLL_SECONDS = 0.25
+
+
+@st.cache_resource
+def get_analysis_loop():
+    """Event loop shared by all sessions, running in a daemon thread"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="analysis-loop", daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def get_unified_llm():
+    """
+    Chat client shared by all analyses, so its HTTP connection pool (and
+    TLS sessions) are reused. Only safe because every analysis runs on the
+    same get_analysis_loop() loop - the pool is bound to one event loop.
+    """
+    return create_unified_llm()
+
+
+def render_updates(updates, container):
+    """Write queued (method, message) updates from the analysis loop into a container"""
+    while True:
+        try:
+            method, message = updates.get_nowait()
+        except queue.Empty:
+            return
+        getattr(container, method)(message)
+
+
+def submit_analysis(coro):
+    """Start a coroutine on the analysis loop, cancelling this session's previous run
+
+    The future is kept in session_state so a run orphaned by a stop or rerun
+    (before wait_for_analysis could cancel it) is cancelled on the next submit.
+    """
+    previous = st.session_state.pop('analysis_future', None)
+    if previous is not None:
+        previous.cancel()
+    future = asyncio.run_coroutine_threadsafe(coro, get_analysis_loop())
+    st.session_state.analysis_future = future
+    return future
 
-    except Exception as e:
-        return None, f"Error parsing file: {str(e)}"
 
+def wait_for_analysis(future, updates, container):
+    """Poll a submitted analysis, rendering its queued updates, and return its result
+
+    Stopping or rerunning the script raises out of the polling loop; the run
+    is cancelled then rather than left working (and billing) in the background.
+    """
+    try:
+        while not future.done():
+            render_updates(updates, container)
+            time.sleep(ANALYSIS_POLL_SECONDS)
+        render_updates(updates, container)
+        return future.result()
     finally:
-        # Clean up temp file
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        if not future.done():
+            future.cancel()
+        st.session_state.pop('analysis_future', None)
+
+
+def analysis_cache_key(contract_text, style_params):
+    """Identify an analysis by the contract's content and the style it ran with"""
+    digest = hashlib.blake2b(contract_text.encode('utf-8'), digest_size=16)
+    digest.update(json.dumps(style_params, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
 
 
-async def analyze_contract_async(contract_text, style_params):
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_policies():
+    """All policies in the unified agent's format, shared across reruns and sessions"""
+    return [
+        {
+            'policy_id': p['policy_id'],
+            'title': p.get('policy_category', 'General Policy'),
+            'requirement': p['policy_text']
+        }
+        for p in get_all_policies()
+    ]
+
+
+def analyze_contract(contract_text, style_params):
     """Run unified agent analysis"""
 
     try:
         st.info(f"📄 Contract length: {len(contract_text):,} characters")
 
-        # Load policies
-        all_policies = get_all_policies()
-
-        # Convert to unified agent format and limit to top 15 most important
-        policies = []
-        for p in all_policies[:15]:  # Limit policies to prevent timeout
-            policies.append({
-                'policy_id': p['policy_id'],
-                'title': p.get('policy_category', 'General Policy'),
-                'requirement': p['policy_text']
-            })
-
-        st.info(f"📋 Loaded {len(policies)} policies for checking (limited to top 15 for performance)")
+        policies = load_policies()
+        st.info(f"📋 Loaded {len(policies)} policies for checking")
 
         # Create unified agent
-        agent = UnifiedContractAgent(style_params=style_params)
-
-        # Analyze
-        with st.spinner("🤖 Analyzing contract with unified agent..."):
-            result = await agent.analyze_contract(
-                contract_text=contract_text,
-                policies=policies
+        agent = UnifiedContractAgent(style_params=style_params, llm=get_unified_llm())
+
+        # Runs on the analysis loop's thread - only queue updates there
+        updates = queue.SimpleQueue()
+
+        def report_batch(number, batch_count, batch_result):
+            findings = batch_result.get('findings', [])
+            updates.put(("write", f"✅ Policy batch {number}/{batch_count}: {len(findings)} findings"))
+            for finding in findings:
+                updates.put((
+                    "markdown",
+                    f"- **{finding.get('severity', 'medium').upper()}** · "
+                    f"{finding.get('clause_reference', 'Unknown')} — "
+                    f"{finding.get('policy_violated', 'Unknown')}"
+                ))
+
+        # Analyze - policies are checked in concurrent batches, so the full set
+        # fits; each batch's findings are listed as soon as it returns
+        with st.status("🤖 Analyzing contract with unified agent...", expanded=True) as status:
+            future = submit_analysis(
+                agent.analyze_contract_batched(
+                    contract_text=contract_text,
+                    policies=policies,
+                    on_batch_complete=report_batch
+                )
             )
+            result = wait_for_analysis(future, updates, status)
+            status.update(label="✅ Agent finished", state="complete", expanded=False)
 
+        # The agent counts findings and edits once, in result['summary']
         findings_count = len(result.get('findings', []))
-        edits_count = sum(1 for f in result.get('findings', []) if f.get('suggested_edit'))
+        edits_count = result.get('summary', {}).get('total_suggested_edits', 0)
 
         st.success(f"✅ Analysis complete: {findings_count} findings, {edits_count} suggested edits")
 
+        for batch_error in result.get('errors', []):
+            st.warning(f"⚠️ {batch_error}")
+
         return result, None
 
     except Exception as e:
         return None, f"Error during analysis: {str(e)}"
 
 
+# Badge colours per risk level (matches the severity classes in _CSS)
+RISK_COLORS = {
+    'critical': '#d62728',
+    'high': '#ff7f0e',
+    'medium': '#ffbb78',
+    'low': '#98df8a'
+}
+
+
+def stat_grid_html(boxes):
+    """Render (value, label, h3 attributes) stat boxes as one CSS grid"""
+    cells = "".join(
+        f'<div class="stat-box"><h3{attrs}>{value}</h3><p>{label}</p></div>'
+        for value, label, attrs in boxes
+    )
+    return f'<div class="stat-grid">{cells}</div>'
+
+
 def display_findings(result):
     """Display findings with suggested edits"""
 
@@ -181,101 +302,25 @@ def display_findings(result):
     by_risk_level = summary.get('by_risk_level', {})
     avg_risk = summary.get('average_risk_score', 0)
 
-    # Row 1: Risk-based metrics
+    # Each row is one grid of stat boxes - a single markdown element
+    # instead of five columns with one element each
     st.markdown("### 🎯 Risk-Based Assessment")
-    col1, col2, col3, col4, col5 = st.columns(5)
+    st.markdown(stat_grid_html([
+        (len(findings), "Total Findings", ''),
+        (by_risk_level.get('critical', 0), "Critical Risk", ' class="critical"'),
+        (by_risk_level.get('high', 0), "High Risk", ' class="high"'),
+        (by_risk_level.get('medium', 0), "Medium Risk", ' class="medium"'),
+        (f"{avg_risk:.1f}", "Avg Risk Score", ' style="color: #1f77b4;"'),
+    ]), unsafe_allow_html=True)
 
-    with col1:
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>{len(findings)}</h3>
-            <p>Total Findings</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        critical_risk = by_risk_level.get('critical', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="critical">{critical_risk}</h3>
-            <p>Critical Risk</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        high_risk = by_risk_level.get('high', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="high">{high_risk}</h3>
-            <p>High Risk</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        medium_risk = by_risk_level.get('medium', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="medium">{medium_risk}</h3>
-            <p>Medium Risk</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col5:
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 style="color: #1f77b4;">{avg_risk:.1f}</h3>
-            <p>Avg Risk Score</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Row 2: Traditional severity + edits
     st.markdown("### 📊 Severity Distribution")
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        critical_count = by_severity.get('critical', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="critical">{critical_count}</h3>
-            <p>Critical Severity</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        high_count = by_severity.get('high', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="high">{high_count}</h3>
-            <p>High Severity</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        medium_count = by_severity.get('medium', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="medium">{medium_count}</h3>
-            <p>Medium Severity</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        low_count = by_severity.get('low', 0)
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 class="low">{low_count}</h3>
-            <p>Low Severity</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col5:
-        edits_count = sum(1 for f in findings if f.get('suggested_edit'))
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3 style="color: #2ca02c;">{edits_count}</h3>
-            <p>Suggested Edits</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(stat_grid_html([
+        (by_severity.get('critical', 0), "Critical Severity", ' class="critical"'),
+        (by_severity.get('high', 0), "High Severity", ' class="high"'),
+        (by_severity.get('medium', 0), "Medium Severity", ' class="medium"'),
+        (by_severity.get('low', 0), "Low Severity", ' class="low"'),
+        (summary.get('total_suggested_edits', 0), "Suggested Edits", ' style="color: #2ca02c;"'),
+    ]), unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -286,19 +331,7 @@ def display_findings(result):
         risk_level = risk_score_data.get('risk_level', 'medium')
         overall_score = risk_score_data.get('overall_score', 0)
 
-        severity_color = {
-            'critical': '#d62728',
-            'high': '#ff7f0e',
-            'medium': '#ffbb78',
-            'low': '#98df8a'
-        }.get(severity, '#999999')
-
-        risk_color = {
-            'critical': '#d62728',
-            'high': '#ff7f0e',
-            'medium': '#ffbb78',
-            'low': '#98df8a'
-        }.get(risk_level, '#999999')
+        risk_color = RISK_COLORS.get(risk_level, '#999999')
 
         with st.expander(
             f"**Finding {i}**: {finding.get('clause_reference', 'Unknown Clause')} - "
@@ -309,47 +342,33 @@ def display_findings(result):
             if risk_score_data:
                 st.markdown("### ⚠️ Risk Assessment")
 
-                col_risk1, col_risk2, col_risk3 = st.columns(3)
-
-                with col_risk1:
-                    likelihood = risk_score_data.get('likelihood', 0)
-                    st.markdown(f"""
-                    <div style="text-align: center; padding: 0.5rem; background-color: {risk_color}20; border-radius: 0.5rem;">
-                        <h4 style="margin: 0;">Likelihood: {likelihood}/5</h4>
-                        <p style="margin: 0; font-size: 0.8rem;">{risk_score_data.get('likelihood_reasoning', 'N/A')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                with col_risk2:
-                    impact = risk_score_data.get('impact', 0)
-                    st.markdown(f"""
-                    <div style="text-align: center; padding: 0.5rem; background-color: {risk_color}20; border-radius: 0.5rem;">
-                        <h4 style="margin: 0;">Impact: {impact}/5</h4>
-                        <p style="margin: 0; font-size: 0.8rem;">{risk_score_data.get('impact_reasoning', 'N/A')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                with col_risk3:
-                    st.markdown(f"""
-                    <div style="text-align: center; padding: 0.5rem; background-color: {risk_color}; color: white; border-radius: 0.5rem;">
-                        <h4 style="margin: 0;">Overall: {overall_score}/25</h4>
-                        <p style="margin: 0; font-size: 0.8rem; font-weight: bold;">{risk_level.upper()} RISK</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                likelihood = risk_score_data.get('likelihood', 0)
+                impact = risk_score_data.get('impact', 0)
+                tile = f'text-align: center; padding: 0.5rem; background-color: {risk_color}20; border-radius: 0.5rem;'
+                st.markdown(
+                    '<div class="risk-grid">'
+                    f'<div style="{tile}"><h4 style="margin: 0;">Likelihood: {likelihood}/5</h4>'
+                    f'<p style="margin: 0; font-size: 0.8rem;">{risk_score_data.get("likelihood_reasoning", "N/A")}</p></div>'
+                    f'<div style="{tile}"><h4 style="margin: 0;">Impact: {impact}/5</h4>'
+                    f'<p style="margin: 0; font-size: 0.8rem;">{risk_score_data.get("impact_reasoning", "N/A")}</p></div>'
+                    f'<div style="text-align: center; padding: 0.5rem; background-color: {risk_color}; color: white; border-radius: 0.5rem;">'
+                    f'<h4 style="margin: 0;">Overall: {overall_score}/25</h4>'
+                    f'<p style="margin: 0; font-size: 0.8rem; font-weight: bold;">{risk_level.upper()} RISK</p></div>'
+                    '</div>',
+                    unsafe_allow_html=True
+                )
 
                 st.markdown("---")
 
-            # Policy violated
-            st.markdown(f"**Policy Violated:** `{finding.get('policy_violated', 'Unknown')}`")
-            st.markdown(f"**Severity Classification:** `{severity.upper()}`")
-
-            # Contract evidence
-            st.markdown("**Evidence from Contract:**")
-            st.markdown(f"> {finding.get('contract_evidence', 'No evidence provided')}")
-
-            # Explanation
-            st.markdown("**Issue Explanation:**")
-            st.write(finding.get('issue_explanation', 'No explanation provided'))
+            # Policy, severity, evidence and explanation in one markdown element
+            st.markdown("\n\n".join([
+                f"**Policy Violated:** `{finding.get('policy_violated', 'Unknown')}`",
+                f"**Severity Classification:** `{severity.upper()}`",
+                "**Evidence from Contract:**",
+                f"> {finding.get('contract_evidence', 'No evidence provided')}",
+                "**Issue Explanation:**",
+                str(finding.get('issue_explanation', 'No explanation provided')),
+            ]))
 
             # Suggested edit
             suggested_edit = finding.get('suggested_edit')
@@ -366,26 +385,133 @@ def display_findings(result):
                 col_a, col_b = st.columns(2)
 
                 with col_a:
-                    st.markdown("**Current Text:**")
-                    st.markdown(f'<div class="deletion">{current_text[:200]}...</div>', unsafe_allow_html=True)
+                    st.markdown(
+                        f'**Current Text:**\n\n<div class="deletion">{current_text[:200]}...</div>',
+                        unsafe_allow_html=True
+                    )
 
                 with col_b:
-                    st.markdown("**Proposed Text:**")
-                    st.markdown(f'<div class="insertion">{proposed_text[:200]}...</div>', unsafe_allow_html=True)
+                    st.markdown(
+                        f'**Proposed Text:**\n\n<div class="insertion">{proposed_text[:200]}...</div>',
+                        unsafe_allow_html=True
+                    )
 
-                # Rationale
+                # Rationale and fallback options in one markdown element
                 rationale = suggested_edit.get('rationale', 'No rationale provided')
-                st.markdown(f"**Rationale:** {rationale}")
+                parts = [f"**Rationale:** {rationale}"]
 
-                # Fallback options
                 fallback_options = finding.get('fallback_options', [])
                 if fallback_options:
-                    st.markdown("**Alternative Options:**")
+                    parts.append("**Alternative Options:**")
+                    lines = []
                     for j, option in enumerate(fallback_options, 1):
-                        st.markdown(f"{j}. {option.get('alternative_text', 'No text')}")
+                        lines.append(f"{j}. {option.get('alternative_text', 'No text')}")
                         if option.get('conditions'):
-                            st.markdown(f"   - Conditions: {', '.join(option['conditions'])}")
-                        st.markdown(f"   - Risk Level: {option.get('risk_level', 'unknown').upper()}")
+                            lines.append(f"   - Conditions: {', '.join(option['conditions'])}")
+                        lines.append(f"   - Risk Level: {option.get('risk_level', 'unknown').upper()}")
+                    parts.append("\n".join(lines))
+
+                st.markdown("\n\n".join(parts))
+
+
+def build_report(result):
+    """Summary report of an analysis result as Markdown"""
+    findings = result.get('findings', [])
+    summary = result.get('summary', {})
+
+    parts = [f"""# Contract Analysis Report
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+## Summary
+- Total Findings: {summary.get('total_findings', 0)}
+- Critical: {summary.get('by_severity', {}).get('critical', 0)}
+- High: {summary.get('by_severity', {}).get('high', 0)}
+- Medium: {summary.get('by_severity', {}).get('medium', 0)}
+- Low: {summary.get('by_severity', {}).get('low', 0)}
+- Suggested Edits: {summary.get('total_suggested_edits', 0)}
+
+## Findings
+
+"""]
+    for i, finding in enumerate(findings, 1):
+        parts.append(f"""### {i}. {finding.get('clause_reference', 'Unknown')} - {finding.get('severity', 'medium').upper()}
+
+**Policy:** {finding.get('policy_violated', 'Unknown')}
+
+**Evidence:**
+> {finding.get('contract_evidence', 'No evidence')}
+
+**Issue:**
+{finding.get('issue_explanation', 'No explanation')}
+
+""")
+        if finding.get('suggested_edit'):
+            edit = finding['suggested_edit']
+            parts.append(f"""**Suggested Edit:**
+- Change: {edit.get('change_summary', 'No summary')}
+- Current: {edit.get('current_text', 'N/A')[:100]}...
+- Proposed: {edit.get('proposed_text', 'N/A')[:100]}...
+- Rationale: {edit.get('rationale', 'No rationale')}
+
+""")
+        parts.append("---\n\n")
+    return "".join(parts)
+
+
+def export_files(analysis_key, result):
+    """JSON and Markdown exports for a result, serialized once per analysis"""
+    cached = st.session_state.get('last_exports')
+    if cached and cached[0] == analysis_key:
+        return cached[1]
+
+    exports = (results_to_json(result), build_report(result))
+    st.session_state.last_exports = (analysis_key, exports)
+    return exports
+
+
+def show_results(result, analysis_key):
+    """Display findings and the export buttons for an analysis result"""
+    st.header("📊 Analysis Results")
+    display_findings(result)
+
+    # Download results - reruns reuse the serialized files
+    json_export, report = export_files(analysis_key, result)
+
+    st.markdown("---")
+    st.subheader("💾 Export Results")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.download_button(
+            label="📥 Download JSON",
+            data=json_export,
+            file_name=f"contract_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json"
+        )
+
+    with col2:
+        st.download_button(
+            label="📥 Download Report (Markdown)",
+            data=report,
+            file_name=f"contract_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+            mime="text/markdown"
+        )
+
+
+def get_timeline(tracker, negotiation_id):
+    """Negotiation timeline, re-read from disk only when the negotiation record changes"""
+    # Keyed on the record's mtime so versions added from other sessions or
+    # the CLI invalidate it too
+    cache_key = (negotiation_id, tracker.get_last_modified(negotiation_id))
+    cached = st.session_state.get('timeline_cache')
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
+    timeline = tracker.get_negotiation_timeline(negotiation_id)
+    # Reading the timeline can auto-create the record, so key on the mtime after the read
+    st.session_state.timeline_cache = ((negotiation_id, tracker.get_last_modified(negotiation_id)), timeline)
+    return timeline
 
 
 def main():
@@ -544,12 +670,15 @@ def main():
         # Analyze button
         if st.button("🚀 Analyze Contract", type="primary"):
             # Run analysis
-            result, error = asyncio.run(analyze_contract_async(contract_text, style_params))
+            result, error = analyze_contract(contract_text, style_params)
 
             if error:
                 st.error(error)
                 return
 
+            analysis_key = analysis_cache_key(contract_text, style_params)
+            st.session_state.last_result = (analysis_key, result)
+
             # Save version to negotiation tracker
             try:
                 version = tracker.add_version(
@@ -563,150 +692,18 @@ def main():
             except ValueError as e:
                 st.warning(f"⚠️ {str(e)}")
 
-            # Display results
-            st.header("📊 Analysis Results")
-            display_findings(result)
-
-            # Download results
-            st.markdown("---")
-            st.subheader("💾 Export Results")
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                json_str = json.dumps(result, indent=2)
-                st.download_button(
-                    label="📥 Download JSON",
-                    data=json_str,
-                    file_name=f"contract_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
-                )
-
-            with col2:
-                # Create summary report
-                findings = result.get('findings', [])
-                summary = result.get('summary', {})
-
-                report = f"""# Contract Analysis Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Summary
-- Total Findings: {summary.get('total_findings', 0)}
-- Critical: {summary.get('by_severity', {}).get('critical', 0)}
-- High: {summary.get('by_severity', {}).get('high', 0)}
-- Medium: {summary.get('by_severity', {}).get('medium', 0)}
-- Low: {summary.get('by_severity', {}).get('low', 0)}
-- Suggested Edits: {summary.get('total_suggested_edits', 0)}
-
-## Findings
-
-"""
-                for i, finding in enumerate(findings, 1):
-                    report += f"""### {i}. {finding.get('clause_reference', 'Unknown')} - {finding.get('severity', 'medium').upper()}
-
-**Policy:** {finding.get('policy_violated', 'Unknown')}
-
-**Evidence:**
-> {finding.get('contract_evidence', 'No evidence')}
-
-**Issue:**
-{finding.get('issue_explanation', 'No explanation')}
-
-"""
-                    if finding.get('suggested_edit'):
-                        edit = finding['suggested_edit']
-                        report += f"""**Suggested Edit:**
-- Change: {edit.get('change_summary', 'No summary')}
-- Current: {edit.get('current_text', 'N/A')[:100]}...
-- Proposed: {edit.get('proposed_text', 'N/A')[:100]}...
-- Rationale: {edit.get('rationale', 'No rationale')}
-
-"""
-                    report += "---\n\n"
-
-                st.download_button(
-                    label="📥 Download Report (Markdown)",
-                    data=report,
-                    file_name=f"contract_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                    mime="text/markdown"
-                )
-
-            # Show negotiation timeline
-            st.markdown("---")
-            st.header("📋 Negotiation Timeline")
-
-            timeline = tracker.get_negotiation_timeline(st.session_state.current_negotiation_id)
-
-            if len(timeline) > 1:
-                st.info(f"📊 {len(timeline)} versions in this negotiation")
-
-            for entry in timeline:
-                with st.expander(
-                    f"**Version {entry['version_number']}** - {entry['uploaded_by'].title()} ({entry['uploaded_at'][:10]})",
-                    expanded=(entry['version_number'] == len(timeline))
-                ):
-                    st.markdown(f"**Uploaded:** {entry['uploaded_at']}")
-                    st.markdown(f"**Source:** {entry['uploaded_by'].title()}")
-
-                    if entry.get('notes'):
-                        st.markdown(f"**Notes:** {entry['notes']}")
-
-                    if entry.get('analysis_summary'):
-                        summary = entry['analysis_summary']
-                        col1, col2, col3, col4 = st.columns(4)
-
-                        with col1:
-                            st.metric("Findings", summary['total_findings'])
-                        with col2:
-                            st.metric("Critical", summary['critical'])
-                        with col3:
-                            st.metric("High", summary['high'])
-                        with col4:
-                            st.metric("Edits", summary['suggested_edits'])
-
-            # Version comparison
-            if len(timeline) > 1:
-                st.markdown("---")
-                st.header("🔀 Compare Versions")
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    v1_num = st.selectbox(
-                        "Base Version",
-                        [i + 1 for i in range(len(timeline))],
-                        index=len(timeline) - 2
-                    )
-
-                with col2:
-                    v2_num = st.selectbox(
-                        "Compare To",
-                        [i + 1 for i in range(len(timeline))],
-                        index=len(timeline) - 1
-                    )
-
-                if st.button("Compare Selected Versions"):
-                    v1_id = timeline[v1_num - 1]['version_id']
-                    v2_id = timeline[v2_num - 1]['version_id']
-
-                    comparison = tracker.compare_versions(v1_id, v2_id)
-
-                    st.markdown(f"### Changes: Version {v1_num} → Version {v2_num}")
-
-                    col_a, col_b, col_c = st.columns(3)
-                    with col_a:
-                        st.metric("Additions", comparison['summary']['additions'])
-                    with col_b:
-                        st.metric("Deletions", comparison['summary']['deletions'])
-                    with col_c:
-                        st.metric("Total Changes", comparison['summary']['total_changes'])
-
-                    st.markdown("### Unified Diff")
-                    st.code(comparison['diff_unified'], language='diff')
+            # Display results (the timeline below picks up the new version)
+            show_results(result, analysis_key)
+        else:
+            # Widget changes rerun the script - keep showing the last analysis
+            # of this contract rather than asking for another agent run
+            last_result = st.session_state.get('last_result')
+            if last_result and last_result[0] == analysis_cache_key(contract_text, style_params):
+                show_results(last_result[1], last_result[0])
 
     # Show timeline and comparison for existing negotiations (outside analyze button)
     if st.session_state.current_negotiation_id:
-        timeline = tracker.get_negotiation_timeline(st.session_state.current_negotiation_id)
+        timeline = get_timeline(tracker, st.session_state.current_negotiation_id)
 
         if len(timeline) > 0:
             st.markdown("---")
@@ -148,10 +148,17 @@ class Settings(BaseSettings):
     # PERFORMANCE
     # ============================================================================
     MAX_CONCURRENT_ANALYSES: int = 5
+    LLM_MAX_CONCURRENCY: int = 10  # Concurrent LLM calls per agent; tune to your API tier
     ANALYSIS_TIMEOUT_SECONDS: int = 300  # 5 minutes
     MAX_CLAUSE_LENGTH: int = 10000  # Characters
     BATCH_SIZE_FINDINGS: int = 50
 
+    # Agent LLM responses cached by prompt + model config, so unchanged
+    # clauses in a revised contract skip the API call
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "./storage/llm_cache.db"
+    LLM_CACHE_TTL_HOURS: int = 24 * 7  # 0 = never expire
+
     # ============================================================================
     # RATE LIMITING
     # ============================================================================
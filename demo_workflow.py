@@ -19,16 +19,12 @@ Usage:
 
 import asyncio
 import os
-from datetime import datetime
+import time
 from typing import List, Dict
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Import workflow and policy helper
-from src.agents.workflow import analyze_contract
-from get_policies import get_policies_for_contract
+# The workflow and policy helper pull in LangChain and the agents, so they
+# are imported inside the demos - after the API key check
 
 
 # =============================================================================
@@ -162,6 +158,8 @@ async def run_demo():
 
     print("✅ ANTHROPIC_API_KEY found\n")
 
+    from get_policies import get_policies_for_contract
+
     # Step 1: Load policies
     print("📋 STEP 1: Loading Policies and Playbook Rules")
     print("-" * 100)
@@ -195,7 +193,7 @@ async def run_demo():
     print("-" * 100)
     print("This will take ~30-60 seconds as each agent processes the contract...\n")
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
     # Configure personality (style parameters)
     style_params = {
@@ -224,7 +222,7 @@ async def run_demo():
         style_params=style_params
     )
 
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.perf_counter() - start_time
 
     print(f"✅ Analysis complete in {duration:.1f} seconds\n")
 
@@ -363,6 +361,7 @@ async def run_streaming_demo():
     print("="*100 + "\n")
 
     from src.agents.workflow import ContractAnalysisWorkflow
+    from get_policies import get_policies_for_contract
 
     # Load data
     policies = get_policies_for_contract(contract_type='saas', model_orientation='buy')
@@ -400,6 +399,9 @@ async def run_streaming_demo():
 if __name__ == "__main__":
     import sys
 
+    # Load environment variables from .env file
+    load_dotenv()
+
     # Check if streaming mode requested
     if len(sys.argv) > 1 and sys.argv[1] == '--stream':
         asyncio.run(run_streaming_demo())
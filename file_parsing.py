@@ -0,0 +1,63 @@
+"""
+Helper for turning uploaded contract files into text
+
+Usage:
+    from file_parsing import parse_file_bytes
+
+    text, error = parse_file_bytes(uploaded_file.name, uploaded_file.getvalue())
+
+Shared by the Streamlit apps, which each wrap it in st.cache_data so the
+same upload is only parsed once.
+"""
+
+import io
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from pdf_extraction import extract_pdf_pages
+
+
+@lru_cache(maxsize=1)
+def _docx_document():
+    """Import python-docx on first use so TXT/PDF uploads never pay for lxml"""
+    from docx import Document
+    return Document
+
+
+def parse_file_bytes(file_name: str, data: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse an uploaded file's bytes to text
+
+    Args:
+        file_name: Original file name (its extension picks the parser)
+        data: Raw file contents
+
+    Returns:
+        (text, None) on success, or (None, error message)
+    """
+    try:
+        # Determine file type and parse
+        extension = Path(file_name).suffix.lower()
+
+        if extension == '.txt':
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError:
+                # Contracts saved from Word/Notepad on Windows are often cp1252
+                text = data.decode('cp1252', errors='replace')
+        elif extension == '.pdf':
+            # Large PDFs are split across worker processes by page range
+            text = "\n\n".join(extract_pdf_pages(data))
+        elif extension in ['.docx', '.doc']:
+            doc = _docx_document()(io.BytesIO(data))
+            # Paragraph.text re-walks the paragraph's XML runs, so read it once
+            paragraph_texts = (p.text for p in doc.paragraphs)
+            text = "\n\n".join(t for t in paragraph_texts if t.strip())
+        else:
+            return None, f"Unsupported file type: {extension}"
+
+        return text, None
+
+    except Exception as e:
+        return None, f"Error parsing file: {str(e)}"
@@ -0,0 +1,230 @@
+"""
+Helper for extracting PDF text with MuPDF/PDFium, or pdfplumber across worker processes
+
+Usage:
+    from pdf_extraction import extract_pdf_pages
+
+    text = "\n\n".join(extract_pdf_pages("contract.pdf"))
+    text = "\n\n".join(extract_pdf_pages(uploaded_file.getvalue()))
+
+Kept free of Streamlit/LangChain imports so worker processes start quickly.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Union
+
+try:
+    import pymupdf  # MuPDF extracts text in native code - much faster than pdfminer
+except ImportError:  # pragma: no cover - optional dependency
+    pymupdf = None
+
+try:
+    import pypdfium2  # PDFium extracts text in native code - much faster than pdfminer
+except ImportError:  # pragma: no cover - optional dependency
+    pypdfium2 = None
+
+# PDFs shorter than this are parsed in-process; worker start-up isn't worth it
+PARALLEL_PDF_MIN_PAGES = 4
+
+# MuPDF is an order of magnitude faster per page than pdfplumber, so it only
+# pays to spread it across workers for long documents, and gains flatten
+# out beyond a few processes
+PARALLEL_MUPDF_MIN_PAGES = 20
+MUPDF_MAX_WORKERS = 4
+
+# Upper bound on the pages one worker task parses, so very long contracts
+# (600+ pages) are processed in slots rather than one huge range per worker
+PDF_RANGE_MAX_PAGES = 100
+
+# Plain text pass for clause splitting: no layout-preserving padding, and
+# pdfplumber's default 3pt tolerances for joining chars into words/lines
+PDFPLUMBER_TEXT_OPTIONS = {"layout": False, "x_tolerance": 3, "y_tolerance": 3}
+
+PdfSource = Union[str, bytes]
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (container/affinity limits, not host cores)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=1)
+def _pdfplumber():
+    """Import pdfplumber on first use - pdfminer is slow to import and PDFium usually suffices"""
+    import pdfplumber
+    return pdfplumber
+
+
+def _open_pdf(source: PdfSource, **kwargs):
+    """Open a PDF from a file path or from in-memory bytes"""
+    if isinstance(source, bytes):
+        return _pdfplumber().open(io.BytesIO(source), **kwargs)
+    return _pdfplumber().open(source, **kwargs)
+
+
+# Set once per worker process by the pool initializer, so range tasks carry
+# only page numbers instead of each pickling a copy of an uploaded PDF (and
+# the bytes never have to be written to disk)
+_worker_pdf: Optional[PdfSource] = None
+
+
+def _init_worker(source: PdfSource) -> None:
+    global _worker_pdf
+    _worker_pdf = source
+
+
+def _pdfplumber_range_task(start: int, stop: int) -> List[str]:
+    return extract_pdf_page_range(_worker_pdf, start, stop)
+
+
+def _pymupdf_range_task(start: int, stop: int) -> List[str]:
+    return extract_pymupdf_page_range(_worker_pdf, start, stop)
+
+
+def _page_ranges(page_count: int, workers: int) -> Tuple[List[int], List[int]]:
+    """Split pages into contiguous [start, stop) ranges, at least two per worker"""
+    # Contiguous ranges let each worker parse the PDF only once per range
+    range_size = min(-(-page_count // (workers * 2)), PDF_RANGE_MAX_PAGES)
+    starts = list(range(0, page_count, range_size))
+    stops = [min(start + range_size, page_count) for start in starts]
+    return starts, stops
+
+
+def extract_pdf_page_range(source: PdfSource, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop) - runs inside a worker process"""
+    page_numbers = list(range(start + 1, stop + 1))  # pdfplumber pages are 1-indexed
+    texts = []
+    with _open_pdf(source, pages=page_numbers) as pdf:
+        for page in pdf.pages:
+            texts.append(page.extract_text(**PDFPLUMBER_TEXT_OPTIONS) or "")
+            # Release pdfminer layout objects as we go
+            page.flush_cache()
+    return texts
+
+
+def _open_pymupdf(source: PdfSource):
+    """Open a PDF with MuPDF from a file path or from in-memory bytes"""
+    if isinstance(source, bytes):
+        return pymupdf.open(stream=source, filetype="pdf")
+    return pymupdf.open(source)
+
+
+def extract_pymupdf_page_range(source: PdfSource, start: int, stop: int) -> List[str]:
+    """Extract MuPDF text for pages [start, stop) - runs inside a worker process"""
+    # Each worker opens its own document; MuPDF documents can't cross processes
+    with _open_pymupdf(source) as doc:
+        return [doc[number].get_text() for number in range(start, stop)]
+
+
+def _extract_pymupdf_pages(source: PdfSource) -> Iterator[str]:
+    """Extract page text with MuPDF, across worker processes for long PDFs"""
+    with _open_pymupdf(source) as doc:
+        page_count = doc.page_count
+        if page_count < PARALLEL_MUPDF_MIN_PAGES:
+            for page in doc:
+                yield page.get_text()
+            return
+
+    workers = min(_available_cpus(), MUPDF_MAX_WORKERS)
+    if workers == 1:
+        yield from extract_pymupdf_page_range(source, 0, page_count)
+        return
+
+    starts, stops = _page_ranges(page_count, workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(source,)) as executor:
+        for texts in executor.map(_pymupdf_range_task, starts, stops):
+            yield from texts
+
+
+def _extract_pdfium_pages(source: PdfSource) -> Iterator[str]:
+    """Extract page text with PDFium"""
+    pdf = pypdfium2.PdfDocument(source)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            yield text.replace("\r\n", "\n")
+    finally:
+        pdf.close()
+
+
+def _extract_pdfplumber_pages(source: PdfSource, first_page: int = 0) -> Iterator[str]:
+    """Extract non-empty page text with pdfplumber, starting at first_page"""
+    with _open_pdf(source) as pdf:
+        page_count = len(pdf.pages)
+
+        if page_count - first_page < PARALLEL_PDF_MIN_PAGES:
+            for page in pdf.pages[first_page:]:
+                text = page.extract_text(**PDFPLUMBER_TEXT_OPTIONS)
+                if text:
+                    yield text
+                # Release pdfminer layout objects as we go
+                page.flush_cache()
+            return
+
+    workers = min(_available_cpus(), page_count - first_page)
+    starts, stops = _page_ranges(page_count - first_page, workers)
+    starts = [start + first_page for start in starts]
+    stops = [stop + first_page for stop in stops]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(source,)) as executor:
+        for texts in executor.map(_pdfplumber_range_task, starts, stops):
+            for text in texts:
+                if text:
+                    yield text
+
+
+def extract_pdf_pages(source: PdfSource) -> Iterator[str]:
+    """
+    Extract text from a PDF one page at a time
+
+    Uses MuPDF (pymupdf) or PDFium (pypdfium2), whichever is installed,
+    preferring MuPDF. Without either, or when they find no text, pages are
+    extracted with pdfplumber - in parallel worker processes for larger
+    documents (pdfplumber is pure Python, so threads would serialize on
+    the GIL).
+
+    Args:
+        source: Path to the PDF, or its raw bytes
+
+    Yields:
+        Text content of each non-empty page, in page order
+    """
+    if pymupdf is not None:
+        native_extractor = _extract_pymupdf_pages
+    elif pypdfium2 is not None:
+        native_extractor = _extract_pdfium_pages
+    else:
+        native_extractor = None
+
+    first_page = 0
+    if native_extractor is not None:
+        found_text = False
+        pages_done = 0
+        try:
+            for text in native_extractor(source):
+                pages_done += 1
+                if text.strip():
+                    found_text = True
+                    yield text
+        except Exception as e:
+            # Damaged or unusual PDFs can make the native libraries raise;
+            # pdfplumber picks up from the first page not yet yielded
+            print(f"⚠️  {native_extractor.__name__} failed after {pages_done} pages, "
+                  f"falling back to pdfplumber: {e!r}")
+            if found_text:
+                first_page = pages_done
+        else:
+            if found_text:
+                return
+
+    yield from _extract_pdfplumber_pages(source, first_page)
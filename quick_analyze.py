@@ -16,15 +16,10 @@ from src.agents.workflow import ContractAnalysisWorkflow
 from get_policies import get_policies_for_contract
 
 
-def extract_clauses_simple(contract_text: str) -> List[Dict]:
-    """
-    Fast extraction using section headers
-    Looks for patterns like "1.", "1.1", "SECTION 1", etc.
-    """
-    clauses = []
-
-    # Common clause type mappings (keywords → clause_type)
-    clause_patterns = {
+# Common clause type mappings (keywords → clause_type), checked in order
+CLAUSE_TYPE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), type_name)
+    for pattern, type_name in {
         'service level|sla|uptime|availability': 'service_levels',
         'limitation of liability|liability cap': 'limitation_of_liability',
         'data protection|privacy|gdpr|dpa': 'data_protection',
@@ -40,81 +35,67 @@ def extract_clauses_simple(contract_text: str) -> List[Dict]:
         'renewal|renew': 'automatic_renewal',
         'assignment|assign': 'assignment',
         'force majeure': 'force_majeure'
-    }
-
-    # Multiple patterns for different contract formats
-    # Pattern 1: "1." or "1.1" at start of line
-    # Pattern 2: "Section 1" or "Article 1"
-    # Pattern 3: All caps headers like "GOVERNING LAW"
-    section_patterns = [
-        r'^\s*(\d+(?:\.\d+)?)[.\s]+(.+?)$',  # "1." or "1.1 Title"
-        r'^\s*(Section|Article|Clause)\s+(\d+(?:\.\d+)?)[:\s]+(.+?)$',  # "Section 1: Title"
-        r'^\s*([A-Z][A-Z\s]{3,})$'  # "GOVERNING LAW"
-    ]
-
-    lines = contract_text.split('\n')
-    current_section = None
-    current_text = []
-    current_identifier = None
-
-    for line in lines:
-        matched = False
-        match = None
-
-        # Try each pattern
-        for pattern in section_patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                matched = True
-                break
-
-        if matched and match:
-            # Save previous section
-            if current_section and current_text:
-                clause_text = '\n'.join(current_text).strip()
-                if len(clause_text) > 20:  # Skip very short sections
-                    # Classify clause type
-                    clause_type = 'other'
-                    for pattern, type_name in clause_patterns.items():
-                        if re.search(pattern, current_section, re.IGNORECASE):
-                            clause_type = type_name
-                            break
-
-                    clauses.append({
-                        'clause_id': f'clause-{len(clauses) + 1}',
-                        'clause_identifier': current_identifier,
-                        'clause_type': clause_type,
-                        'clause_text': clause_text
-                    })
-
-            # Start new section - handle different match groups
-            groups = match.groups()
-            if len(groups) >= 2:
-                current_identifier = groups[0].strip() if groups[0] else f"Section {len(clauses)+1}"
-                current_section = groups[-1].strip() if groups[-1] else groups[0].strip()
-            else:
-                current_identifier = groups[0].strip()
-                current_section = groups[0].strip()
-            current_text = [line]
+    }.items()
+]
+
+# Section headers for different contract formats, as one multiline pattern so
+# the whole contract is scanned in a single pass. Alternatives are tried in
+# order; whitespace classes exclude '\n' so a match never spans lines.
+#   1. "1." or "1.1 Title" at start of line
+#   2. "Section 1: Title" / "Article 1" / "Clause 1"
+#   3. All caps headers like "GOVERNING LAW"
+_WS = r'[^\S\n]'
+SECTION_HEADER_RE = re.compile(
+    rf'^{_WS}*(\d+(?:\.\d+)?)(?:\.|{_WS})+(.+?)$'
+    rf'|^{_WS}*(Section|Article|Clause){_WS}+(\d+(?:\.\d+)?)(?::|{_WS})+(.+?)$'
+    rf'|^{_WS}*([A-Z](?:[A-Z]|{_WS}){{3,}})$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _classify_clause(text: str) -> str:
+    for pattern, type_name in CLAUSE_TYPE_PATTERNS:
+        if pattern.search(text):
+            return type_name
+    return 'other'
+
+
+def extract_clauses_simple(contract_text: str) -> List[Dict]:
+    """
+    Fast extraction using section headers
+    Looks for patterns like "1.", "1.1", "SECTION 1", etc.
+    """
+    clauses = []
+
+    headers = []
+    for match in SECTION_HEADER_RE.finditer(contract_text):
+        if match.group(1) is not None:
+            groups = match.group(1, 2)
+        elif match.group(3) is not None:
+            groups = match.group(3, 4, 5)
         else:
-            # Continue current section
-            if current_section:
-                current_text.append(line)
-
-    # Save last section
-    if current_section and current_text:
-        clause_text = '\n'.join(current_text).strip()
-        if len(clause_text) > 20:
-            clause_type = 'other'
-            for pattern, type_name in clause_patterns.items():
-                if re.search(pattern, current_section, re.IGNORECASE):
-                    clause_type = type_name
-                    break
+            groups = (match.group(6),)
 
+        # Handle different match groups
+        if len(groups) >= 2:
+            identifier = groups[0].strip() if groups[0] else f"Section {len(headers)+1}"
+            section = groups[-1].strip() if groups[-1] else groups[0].strip()
+        else:
+            identifier = groups[0].strip()
+            section = groups[0].strip()
+        headers.append((match.start(), identifier, section))
+
+    # Each section runs from its header line to the next header
+    ends = [start for start, _, _ in headers[1:]] + [len(contract_text)]
+    for (start, identifier, section), end in zip(headers, ends):
+        if not section:
+            continue
+        clause_text = contract_text[start:end].strip()
+        if len(clause_text) > 20:  # Skip very short sections
             clauses.append({
                 'clause_id': f'clause-{len(clauses) + 1}',
-                'clause_identifier': current_identifier,
-                'clause_type': clause_type,
+                'clause_identifier': identifier,
+                'clause_type': _classify_clause(section),
                 'clause_text': clause_text
             })
 
@@ -124,17 +105,10 @@ def extract_clauses_simple(contract_text: str) -> List[Dict]:
         for i, para in enumerate(paragraphs, 1):
             para = para.strip()
             if len(para) > 50:  # Only meaningful paragraphs
-                # Try to classify
-                clause_type = 'other'
-                for pattern, type_name in clause_patterns.items():
-                    if re.search(pattern, para, re.IGNORECASE):
-                        clause_type = type_name
-                        break
-
                 clauses.append({
                     'clause_id': f'clause-{i}',
                     'clause_identifier': f'Paragraph {i}',
-                    'clause_type': clause_type,
+                    'clause_type': _classify_clause(para),
                     'clause_text': para
                 })
 
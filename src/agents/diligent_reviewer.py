@@ -7,21 +7,37 @@ REQ-DR-004: Structured Findings Output
 REQ-DR-005: Traceability with Provenance Logging
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
 import json
 import asyncio
+import hashlib
 import time
 
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 
 from config.settings import settings
+from src.services.llm_cache import CachedLLMClient, parse_json_content
 from src.agents.state import AnalysisContext, update_context_metadata, log_error_to_context
 from src.services.embedding_service import embedding_service
 
 
+def _parse_json_array(content: str) -> List:
+    """Batched checks must come back as a JSON array to be worth caching"""
+    parsed = parse_json_content(content)
+    if not isinstance(parsed, list):
+        raise ValueError("Expected a JSON array of check results")
+    return parsed
+
+
+def _matchable_clause_type(clause: Dict) -> Optional[str]:
+    """Clause type to match policies on, or None for untyped/"other" clauses"""
+    clause_type = clause.get('clause_type')
+    return None if clause_type == 'other' else clause_type
+
+
 class DiligentReviewerAgent:
     """
     Diligent Reviewer Agent - First stage of analysis
@@ -33,15 +49,22 @@ class DiligentReviewerAgent:
     - Generate structured findings with complete provenance
     """
 
+    # Clause-policy pairs sent per LLM call; beyond ~10 the responses get
+    # long enough that accuracy and latency drop off
+    BATCH_SIZE = 10
+
     def __init__(self):
         # Use GPT-4o-mini for fast, cheap policy checking
-        self.llm = ChatOpenAI(
+        self.llm = CachedLLMClient(ChatOpenAI(
             model="gpt-4o-mini",  # Fast model for simple compliance checks
             max_tokens=512,  # Simple JSON responses
             temperature=0.1,  # Low temperature for consistent policy checking
             timeout=30,
+            max_retries=0,  # CachedLLMClient does the retrying
             openai_api_key=settings.OPENAI_API_KEY
-        )
+        ))
+        # Same client with room for one JSON result per pair in a batch
+        self.batch_llm = self.llm.bind(max_tokens=256 * self.BATCH_SIZE)
 
     async def process(self, state: AnalysisContext) -> AnalysisContext:
         """
@@ -63,6 +86,20 @@ class DiligentReviewerAgent:
             policies = state['policies']
             version_id = state['version_id']
 
+            # Clauses without a type are matched by semantic similarity -
+            # embed and search them all in one batch, off the event loop
+            untyped_clauses = [clause for clause in clauses if not _matchable_clause_type(clause)]
+            similar_by_clause = {}
+            if untyped_clauses:
+                similar = await asyncio.to_thread(
+                    embedding_service.search_similar_policies_batch,
+                    [clause['clause_text'] for clause in untyped_clauses],
+                    3
+                )
+                similar_by_clause = {
+                    id(clause): matches for clause, matches in zip(untyped_clauses, similar)
+                }
+
             # Pre-generate unique clause-policy pairs to check
             pairs_to_check = []
             checked_pairs = set()
@@ -71,7 +108,8 @@ class DiligentReviewerAgent:
                 # Find relevant policies for this clause
                 relevant_policies = await self._get_relevant_policies(
                     clause,
-                    policies
+                    policies,
+                    similar_by_clause.get(id(clause))
                 )
 
                 for policy in relevant_policies:
@@ -86,9 +124,18 @@ class DiligentReviewerAgent:
                     checked_pairs.add(pair_key)
                     pairs_to_check.append((clause, policy))
 
+            # Repeated boilerplate (identical arbitration, jurisdiction
+            # paragraphs...) only needs one LLM check per policy; the result
+            # is fanned back out to every clause sharing the text
+            pair_groups: Dict[bytes, List[Tuple[Dict, Dict]]] = {}
+            for clause, policy in pairs_to_check:
+                pair_groups.setdefault(self._pair_content_key(clause, policy), []).append((clause, policy))
+            unique_groups = list(pair_groups.values())
+
             # Parallel execution with bounded concurrency
-            pairs_count = len(pairs_to_check)
-            print(f"🔍 DiligentReviewer: Found {pairs_count} clause-policy pairs to check")
+            pairs_count = len(unique_groups)
+            print(f"🔍 DiligentReviewer: Found {pairs_count} clause-policy pairs to check "
+                  f"({len(pairs_to_check) - pairs_count} duplicates skipped)")
 
             # Add to errors list so it shows in UI
             state['errors'].append(f"DEBUG: Checking {pairs_count} clause-policy pairs")
@@ -97,44 +144,56 @@ class DiligentReviewerAgent:
                 start_time = time.time()
 
                 # Semaphore limits concurrent LLM calls to prevent rate limiting
-                # Increased to 10 for better throughput with Haiku (faster model)
-                semaphore = asyncio.Semaphore(10)  # Max 10 concurrent calls
+                semaphore = asyncio.Semaphore(
+                    state.get('max_llm_concurrency') or settings.LLM_MAX_CONCURRENCY
+                )
 
-                async def check_with_limit(clause, policy):
-                    """Wrapper to enforce concurrency limit"""
-                    async with semaphore:
-                        return await self._check_policy_compliance(
-                            clause,
-                            policy,
-                            version_id
+                # Several pairs per call so the system prompt and round trip
+                # are paid once per batch instead of once per pair
+                batches = [
+                    unique_groups[i:i + self.BATCH_SIZE]
+                    for i in range(0, pairs_count, self.BATCH_SIZE)
+                ]
+
+                # Execute batches in parallel and collect results
+                batch_results = await asyncio.gather(
+                    *(
+                        self._check_policy_compliance_batch(
+                            [group[0] for group in batch],
+                            version_id,
+                            semaphore
                         )
-
-                # Create all tasks
-                tasks = [check_with_limit(clause, policy) for clause, policy in pairs_to_check]
-
-                # Execute in parallel and collect results
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                        for batch in batches
+                    ),
+                    return_exceptions=True
+                )
 
                 # Process results
                 findings_count = 0
                 errors_count = 0
 
-                for result in results:
-                    if isinstance(result, Exception):
-                        # Log error and add to state
-                        error_msg = f"Policy check failed: {str(result)}"
-                        print(f"Warning: {error_msg}")
-                        state['errors'].append(error_msg)
-                        errors_count += 1
-                    elif result:
-                        state['findings'].append(result)
-                        findings_count += 1
+                for batch, results in zip(batches, batch_results):
+                    if isinstance(results, Exception):
+                        results = [results] * len(batch)
+                    for group, result in zip(batch, results):
+                        if isinstance(result, Exception):
+                            # Log error and add to state
+                            error_msg = f"Policy check failed: {str(result)}"
+                            print(f"Warning: {error_msg}")
+                            state['errors'].append(error_msg)
+                            errors_count += 1
+                        elif result:
+                            state['findings'].append(result)
+                            for clause, _ in group[1:]:
+                                state['findings'].append(self._copy_finding_for_clause(result, clause))
+                            findings_count += len(group)
 
                 elapsed = time.time() - start_time
-                avg_time = elapsed / len(tasks) if tasks else 0
+                avg_time = elapsed / pairs_count
 
-                print(f"✅ Diligent Reviewer: Processed {len(tasks)} checks in {elapsed:.1f}s "
-                      f"(avg {avg_time:.1f}s/check, {findings_count} findings, {errors_count} errors)")
+                print(f"✅ Diligent Reviewer: Processed {pairs_count} checks in {len(batches)} batches "
+                      f"in {elapsed:.1f}s (avg {avg_time:.1f}s/check, {findings_count} findings, "
+                      f"{errors_count} errors)")
 
             # Update workflow stage
             state['workflow_stage'] = 'rationalizing'
@@ -147,7 +206,8 @@ class DiligentReviewerAgent:
     async def _get_relevant_policies(
         self,
         clause: Dict,
-        all_policies: List[Dict]
+        all_policies: List[Dict],
+        similar_policies: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Find policies relevant to this clause
@@ -156,11 +216,12 @@ class DiligentReviewerAgent:
         Args:
             clause: Clause dict with clause_text and optional clause_type
             all_policies: All available policies
+            similar_policies: Precomputed semantic matches for an untyped clause
 
         Returns:
             List of relevant policies (deduplicated)
         """
-        clause_type = clause.get('clause_type')
+        clause_type = _matchable_clause_type(clause)
         relevant = []
         seen_policy_ids = set()
 
@@ -181,6 +242,8 @@ class DiligentReviewerAgent:
                 elif clause_type in policy.get('applicable_clauses', []):
                     relevant.append(policy)
                     seen_policy_ids.add(policy_id)
+        elif similar_policies is not None:
+            relevant = similar_policies
         else:
             # Use semantic similarity if no clause type
             relevant = embedding_service.search_similar_policies(
@@ -254,7 +317,8 @@ Analyze compliance and return JSON:""")
                 prompt.format(
                     policy_text=policy['policy_text'],
                     clause_text=clause['clause_text']
-                )
+                ),
+                validate=parse_json_content
             )
 
             # Parse response (handle markdown code blocks)
@@ -265,29 +329,7 @@ Analyze compliance and return JSON:""")
                 content = content.rsplit('\n```', 1)[0]  # Remove last line with ```
             result = json.loads(content)
 
-            # REQ-DR-002: Silent pass for compliant clauses
-            if not result.get('has_deviation'):
-                return None
-
-            # REQ-DR-003: Validate evidence for high-risk findings
-            severity = result.get('severity', 'medium')
-            if severity in ['high', 'critical']:
-                if not result.get('evidence_quote'):
-                    # If LLM didn't provide evidence, extract it ourselves
-                    result['evidence_quote'] = clause['clause_text'][:200]
-
-            # REQ-DR-004: Create structured finding
-            finding = self._create_structured_finding(
-                clause=clause,
-                policy=policy,
-                deviation_type=result['deviation_type'],
-                severity=severity,
-                evidence_quote=result['evidence_quote'],
-                explanation=result.get('explanation', ''),
-                version_id=version_id
-            )
-
-            return finding
+            return self._finding_from_result(clause, policy, result, version_id)
 
         except json.JSONDecodeError as e:
             # LLM didn't return valid JSON - raise so it gets caught and logged
@@ -301,6 +343,162 @@ Analyze compliance and return JSON:""")
             print(error_msg)
             raise
 
+    async def _check_policy_compliance_batch(
+        self,
+        pairs: List[Tuple[Dict, Dict]],
+        version_id: str,
+        semaphore: asyncio.Semaphore
+    ) -> List[Optional[Dict]]:
+        """
+        Check several clause-policy pairs in a single LLM call
+
+        Results are matched back to pairs by id. Pairs the model skipped are
+        re-checked individually so a partial response never drops a finding.
+        Every LLM call, including those re-checks, holds a semaphore slot.
+
+        Args:
+            pairs: (clause, policy) tuples, at most BATCH_SIZE
+            version_id: Version ID for provenance
+            semaphore: Limits concurrent LLM calls across all batches
+
+        Returns:
+            One entry per pair: finding dict, None if compliant, or the
+            exception raised while checking it
+        """
+        if len(pairs) == 1:
+            clause, policy = pairs[0]
+            async with semaphore:
+                return [await self._check_policy_compliance(clause, policy, version_id)]
+
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are a legal compliance expert analyzing contract clauses against policy requirements.
+
+**Your Task**: For each numbered check, determine if the clause complies with the policy.
+
+**Rules**:
+1. Return ONLY a JSON array (no markdown, no code blocks) with one object per check
+2. Every object includes the check's "id"
+3. If compliant: {{"id": 1, "has_deviation": false}}
+4. If non-compliant:
+{{
+  "id": 1,
+  "has_deviation": true,
+  "deviation_type": "missing_clause|excessive_value|prohibited_term|incomplete_requirement",
+  "severity": "low|medium|high|critical",
+  "evidence_quote": "exact quote from clause showing the deviation",
+  "explanation": "brief objective explanation (one sentence)"
+}}
+
+**Severity Guidelines**:
+- critical: Legal risk, deal-breaker, regulatory violation
+- high: Significant financial or operational risk
+- medium: Moderate risk, negotiable
+- low: Minor deviation, style/format issue
+
+**Evidence Requirements**:
+- For high/critical severity: MUST provide exact quote
+- Quote must be verbatim from the clause
+- Quote should be 10-50 words highlighting the issue
+
+Judge each check independently. Be strict and objective. Every claim must be supported by evidence."""),
+            ("user", """{checks}
+
+Analyze compliance for every check and return the JSON array:""")
+        ])
+
+        checks = "\n\n".join(
+            f"### Check {i}\nPolicy Requirement:\n{policy['policy_text']}\n\n"
+            f"Contract Clause:\n{clause['clause_text']}"
+            for i, (clause, policy) in enumerate(pairs, start=1)
+        )
+
+        async with semaphore:
+            response = await self.batch_llm.ainvoke(
+                prompt.format(checks=checks),
+                validate=_parse_json_array
+            )
+
+        # Parse response (handle markdown code blocks)
+        content = response.content.strip()
+        if content.startswith('```'):
+            nl = content.find('\n')
+            end = content.rfind('\n```')
+            content = content[nl + 1:end] if end > nl else content[nl + 1:]
+
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            print(f"Warning: Invalid JSON from batched check, retrying {len(pairs)} pairs individually")
+            parsed = []
+
+        results_by_id = {}
+        if isinstance(parsed, list):
+            for item in parsed:
+                if isinstance(item, dict) and isinstance(item.get('id'), int):
+                    results_by_id[item['id']] = item
+
+        async def resolve(index, clause, policy):
+            result = results_by_id.get(index)
+            try:
+                if result is None:
+                    async with semaphore:
+                        return await self._check_policy_compliance(clause, policy, version_id)
+                return self._finding_from_result(clause, policy, result, version_id)
+            except Exception as e:
+                return e
+
+        return await asyncio.gather(*(
+            resolve(i, clause, policy)
+            for i, (clause, policy) in enumerate(pairs, start=1)
+        ))
+
+    def _finding_from_result(
+        self,
+        clause: Dict,
+        policy: Dict,
+        result: Dict,
+        version_id: str
+    ) -> Optional[Dict]:
+        """Turn a parsed compliance result into a finding (None if compliant)"""
+        # REQ-DR-002: Silent pass for compliant clauses
+        if not result.get('has_deviation'):
+            return None
+
+        # REQ-DR-003: Validate evidence for high-risk findings
+        severity = result.get('severity', 'medium')
+        if severity in ['high', 'critical']:
+            if not result.get('evidence_quote'):
+                # If LLM didn't provide evidence, extract it ourselves
+                result['evidence_quote'] = clause['clause_text'][:200]
+
+        # REQ-DR-004: Create structured finding
+        return self._create_structured_finding(
+            clause=clause,
+            policy=policy,
+            deviation_type=result['deviation_type'],
+            severity=severity,
+            evidence_quote=result['evidence_quote'],
+            explanation=result.get('explanation', ''),
+            version_id=version_id
+        )
+
+    @staticmethod
+    def _pair_content_key(clause: Dict, policy: Dict) -> bytes:
+        """Key a clause-policy pair on case/whitespace-normalized clause text"""
+        text = " ".join(clause.get('clause_text', '').lower().split())
+        payload = f"{text}\x00{policy.get('policy_id')}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+    @staticmethod
+    def _copy_finding_for_clause(finding: Dict, clause: Dict) -> Dict:
+        """Re-issue a finding for another clause with the same text"""
+        return {
+            **finding,
+            'finding_id': str(uuid4()),
+            'clause_id': clause.get('clause_id'),
+            'provenance': dict(finding['provenance']),
+        }
+
     def _create_structured_finding(
         self,
         clause: Dict,
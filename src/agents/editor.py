@@ -12,11 +12,13 @@ from uuid import uuid4
 from datetime import datetime
 import json
 import re
+import asyncio
 
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 
 from config.settings import settings
+from src.services.llm_cache import CachedLLMClient, parse_json_content
 from src.agents.state import AnalysisContext, update_context_metadata, log_error_to_context
 
 
@@ -34,13 +36,14 @@ class EditorAgent:
 
     def __init__(self):
         # Use Sonnet 3.5 for structured edit generation
-        self.llm = ChatOpenAI(
+        self.llm = CachedLLMClient(ChatOpenAI(
             model="gpt-4o-mini",  # Balanced model for precise edits
             max_tokens=1024,  # Track-change JSON responses
             temperature=0.1,  # Low temperature for precise positioning
             timeout=30,
+            max_retries=0,  # CachedLLMClient does the retrying
             openai_api_key=settings.OPENAI_API_KEY
-        )
+        ))
 
     async def process(self, state: AnalysisContext) -> AnalysisContext:
         """
@@ -74,8 +77,17 @@ class EditorAgent:
             findings_by_id = {f['finding_id']: f for f in findings}
             clauses_by_id = {c['clause_id']: c for c in clauses}
 
-            # Generate edits for each transformed rationale
-            suggested_edits = []
+            # Generate edits for each transformed rationale in parallel,
+            # bounded to respect API rate limits
+            semaphore = asyncio.Semaphore(
+                state.get('max_llm_concurrency') or settings.LLM_MAX_CONCURRENCY
+            )
+
+            async def generate_with_limit(**kwargs):
+                async with semaphore:
+                    return await self.generate_edit(**kwargs)
+
+            tasks = []
             for transformation in transformed_rationales:
                 # Get neutral rationale and finding
                 neutral = neutral_by_id.get(transformation['rationale_id'])
@@ -92,15 +104,15 @@ class EditorAgent:
                     continue
 
                 # Generate suggested edit
-                edit = await self.generate_edit(
+                tasks.append(generate_with_limit(
                     transformation=transformation,
                     neutral_rationale=neutral,
                     finding=finding,
                     clause=clause
-                )
+                ))
 
-                if edit:
-                    suggested_edits.append(edit)
+            # generate_edit handles its own errors and returns None on failure
+            suggested_edits = [edit for edit in await asyncio.gather(*tasks) if edit]
 
             # REQ-SE-003: Detect conflicts between edits
             suggested_edits = self._detect_conflicts(suggested_edits)
@@ -199,7 +211,8 @@ Generate track-change format JSON:""")
                     current=json.dumps(proposed_change.get('current')),
                     proposed=json.dumps(proposed_change['proposed']),
                     reasoning=proposed_change['reasoning']
-                )
+                ),
+                validate=parse_json_content
             )
 
             # Parse response (handle markdown code blocks)
@@ -286,39 +299,45 @@ Generate track-change format JSON:""")
             if len(clause_edits) <= 1:
                 continue  # No conflicts possible
 
-            # Compare each pair
-            for i, edit1 in enumerate(clause_edits):
-                for edit2 in clause_edits[i+1:]:
-                    if self._edits_overlap(edit1, edit2):
-                        # Mark conflict
-                        edit1['conflicts_with'].append(edit2['edit_id'])
-                        edit2['conflicts_with'].append(edit1['edit_id'])
+            # Mark conflicts in pair order so conflicts_with is deterministic
+            for i, j in sorted(self._overlapping_edit_pairs(clause_edits)):
+                edit1, edit2 = clause_edits[i], clause_edits[j]
+                edit1['conflicts_with'].append(edit2['edit_id'])
+                edit2['conflicts_with'].append(edit1['edit_id'])
 
         return edits
 
-    def _edits_overlap(self, edit1: Dict, edit2: Dict) -> bool:
+    def _overlapping_edit_pairs(self, edits: List[Dict]) -> set:
         """
-        Check if two edits have overlapping character ranges
+        Find overlapping edits with a sort-and-sweep over their ranges
+
+        Ranges are visited in start order while tracking those still open,
+        so only ranges that can actually overlap are compared instead of
+        every range of every pair of edits.
 
         Args:
-            edit1: First edit
-            edit2: Second edit
+            edits: Edits targeting the same clause
 
         Returns:
-            True if edits overlap
+            Set of (i, j) index pairs, i < j, whose ranges overlap
         """
-        # Get character ranges for each edit
-        ranges1 = self._get_edit_ranges(edit1)
-        ranges2 = self._get_edit_ranges(edit2)
-
-        # Check if any ranges overlap
-        for start1, end1 in ranges1:
-            for start2, end2 in ranges2:
-                # Overlap if one range starts before the other ends
-                if not (end1 <= start2 or end2 <= start1):
-                    return True
-
-        return False
+        spans = sorted(
+            (start, end, index)
+            for index, edit in enumerate(edits)
+            for start, end in self._get_edit_ranges(edit)
+        )
+
+        pairs = set()
+        active: List[Tuple[int, int, int]] = []
+        for start, end, index in spans:
+            # Ranges ending at or before this start can't overlap anything later
+            active = [span for span in active if span[1] > start]
+            for other_start, _, other_index in active:
+                if other_index != index and other_start < end:
+                    pairs.add((min(index, other_index), max(index, other_index)))
+            active.append((start, end, index))
+
+        return pairs
 
     def _get_edit_ranges(self, edit: Dict) -> List[Tuple[int, int]]:
         """
@@ -19,6 +19,7 @@ from langchain.prompts import ChatPromptTemplate
 from textblob import TextBlob
 
 from config.settings import settings
+from src.services.llm_cache import CachedLLMClient, parse_json_content
 from src.agents.state import AnalysisContext, update_context_metadata, log_error_to_context
 
 
@@ -43,13 +44,14 @@ class NeutralRationaleAgent:
 
     def __init__(self):
         # Use Sonnet 3.5 for balanced speed/quality in rationale generation
-        self.llm = ChatOpenAI(
+        self.llm = CachedLLMClient(ChatOpenAI(
             model="gpt-4o-mini",  # Balanced model for objective analysis
             max_tokens=1024,  # Rationale + proposed change
             temperature=0.2,  # Low temperature for neutral, objective output
             timeout=30,
+            max_retries=0,  # CachedLLMClient does the retrying
             openai_api_key=settings.OPENAI_API_KEY
-        )
+        ))
 
     async def process(self, state: AnalysisContext) -> AnalysisContext:
         """
@@ -73,8 +75,16 @@ class NeutralRationaleAgent:
                 state['workflow_stage'] = 'styling'
                 return state
 
-            # Generate rationales in parallel for speed
-            tasks = [self.generate_rationale(finding) for finding in findings]
+            # Generate rationales in parallel, bounded to respect API rate limits
+            semaphore = asyncio.Semaphore(
+                state.get('max_llm_concurrency') or settings.LLM_MAX_CONCURRENCY
+            )
+
+            async def generate_with_limit(finding):
+                async with semaphore:
+                    return await self.generate_rationale(finding)
+
+            tasks = [generate_with_limit(finding) for finding in findings]
             rationales = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Add successful rationales to context
@@ -162,7 +172,8 @@ Generate neutral rationale in JSON format:""")
                     evidence_quote=finding.get('evidence_quote', ''),
                     policy_requirement=finding.get('policy_requirement', ''),
                     explanation=finding.get('explanation', '')
-                )
+                ),
+                validate=parse_json_content
             )
 
             # Parse response (handle markdown code blocks)
@@ -20,6 +20,7 @@ from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 
 from config.settings import settings
+from src.services.llm_cache import CachedLLMClient
 from src.agents.state import AnalysisContext, update_context_metadata, log_error_to_context
 from src.services.cache_service import cache_service
 
@@ -39,13 +40,14 @@ class PersonalityAgent:
     """
 
     def __init__(self):
-        self.llm = ChatOpenAI(
+        self.llm = CachedLLMClient(ChatOpenAI(
             model=settings.CLAUDE_MODEL,
             max_tokens=settings.CLAUDE_MAX_TOKENS,
             temperature=settings.CLAUDE_TEMPERATURE,
             timeout=30,
+            max_retries=0,  # CachedLLMClient does the retrying
             openai_api_key=settings.OPENAI_API_KEY
-        )
+        ))
 
     async def process(self, state: AnalysisContext) -> AnalysisContext:
         """
@@ -76,13 +78,18 @@ class PersonalityAgent:
             findings = state.get('findings', [])
             findings_by_id = {f['finding_id']: f for f in findings}
 
-            # Process rationales in parallel
+            # Process rationales in parallel, bounded to respect API rate limits
+            semaphore = asyncio.Semaphore(
+                state.get('max_llm_concurrency') or settings.LLM_MAX_CONCURRENCY
+            )
+
             async def process_one(rationale):
                 finding = findings_by_id.get(rationale['finding_id'])
                 cached = await cache_service.get_transformation(rationale['rationale_id'], style_params)
                 if cached:
                     return cached
-                transformation = await self.transform_rationale(rationale, style_params, finding)
+                async with semaphore:
+                    transformation = await self.transform_rationale(rationale, style_params, finding)
                 if transformation:
                     await cache_service.set_transformation(rationale['rationale_id'], style_params, transformation)
                 return transformation
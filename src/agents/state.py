@@ -69,6 +69,9 @@ class AnalysisContext(TypedDict):
     }
     """
 
+    max_llm_concurrency: Optional[int]
+    """Cap on concurrent LLM calls per agent (None = settings.LLM_MAX_CONCURRENCY)"""
+
     # ============================================================================
     # AGENT OUTPUTS (Accumulated during workflow)
     # ============================================================================
@@ -159,7 +162,8 @@ def create_initial_context(
     contract_text: str,
     clauses: List[Dict],
     policies: List[Dict],
-    style_params: Optional[Dict] = None
+    style_params: Optional[Dict] = None,
+    max_llm_concurrency: Optional[int] = None
 ) -> AnalysisContext:
     """
     Create initial context for workflow
@@ -171,6 +175,7 @@ def create_initial_context(
         clauses: Extracted clauses
         policies: Applicable policies
         style_params: Optional personality settings (uses org defaults if None)
+        max_llm_concurrency: Optional cap on concurrent LLM calls per agent
 
     Returns:
         Initial AnalysisContext ready for workflow
@@ -193,6 +198,7 @@ def create_initial_context(
         clauses=clauses,
         policies=policies,
         style_params=style_params or default_style,
+        max_llm_concurrency=max_llm_concurrency,
 
         # Outputs (empty initially, will be populated by agents)
         findings=[],
@@ -10,8 +10,10 @@ Key improvements:
 - Memory for personality consistency
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from collections import Counter
+import asyncio
 import json
 
 from langchain_openai import ChatOpenAI
@@ -19,6 +21,52 @@ from langchain.prompts import ChatPromptTemplate
 from langchain.schema import HumanMessage, SystemMessage
 
 from config.settings import settings
+from src.services.llm_cache import CachedLLMClient, parse_json_content
+
+
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low')
+
+
+def summarize_findings(findings: List[Dict]) -> Dict:
+    """
+    Count findings by severity, risk level and suggested edits in one pass
+
+    Returns:
+        Summary fields in the shape of an analysis result's 'summary'
+    """
+    severity_counts = Counter()
+    risk_counts = Counter()
+    edits = 0
+    for finding in findings:
+        severity_counts[finding.get('severity')] += 1
+        risk_counts[(finding.get('risk_score') or {}).get('risk_level')] += 1
+        if finding.get('suggested_edit'):
+            edits += 1
+
+    return {
+        'total_findings': len(findings),
+        'by_severity': {level: severity_counts[level] for level in SEVERITY_LEVELS},
+        'by_risk_level': {level: risk_counts[level] for level in SEVERITY_LEVELS},
+        'total_suggested_edits': edits
+    }
+
+
+def create_unified_llm() -> CachedLLMClient:
+    """
+    Build the chat client the unified agent analyzes with
+
+    Callers that run many analyses (e.g. the Streamlit app) build this once
+    and pass it to every agent, so the HTTP connection pool is reused.
+    """
+    return CachedLLMClient(ChatOpenAI(
+        model="gpt-4o-mini",  # Fast and cost-effective
+        max_tokens=4096,  # Need space for full contract + analysis
+        temperature=0.2,  # Low temp for consistency
+        timeout=120,  # Longer timeout for large contracts
+        request_timeout=120,
+        max_retries=0,  # CachedLLMClient does the retrying
+        openai_api_key=settings.OPENAI_API_KEY
+    ))
 
 
 class UnifiedContractAgent:
@@ -33,21 +81,20 @@ class UnifiedContractAgent:
     5. Apply personality/style in same pass (no separate transformation)
     """
 
-    def __init__(self, style_params: Optional[Dict] = None):
+    # Policies checked per LLM call by analyze_contract_batched; the whole
+    # contract goes with every batch, so the response for each batch (with
+    # its edits) stays well inside max_tokens
+    POLICY_BATCH_SIZE = 8
+
+    def __init__(self, style_params: Optional[Dict] = None, llm: Optional[CachedLLMClient] = None):
         """
         Initialize agent with personality settings
 
         Args:
             style_params: Optional style configuration (tone, formality, aggressiveness, audience)
+            llm: Optional shared client from create_unified_llm() (a new one is built if None)
         """
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",  # Fast and cost-effective
-            max_tokens=4096,  # Need space for full contract + analysis
-            temperature=0.2,  # Low temp for consistency
-            timeout=120,  # Longer timeout for large contracts
-            request_timeout=120,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
+        self.llm = llm or create_unified_llm()
 
         # Default style params
         self.style_params = style_params or {
@@ -84,7 +131,7 @@ class UnifiedContractAgent:
         response = await self.llm.ainvoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
-        ])
+        ], validate=parse_json_content)
 
         # Parse structured response
         try:
@@ -104,6 +151,12 @@ class UnifiedContractAgent:
 
             result = json.loads(content)
 
+            # Recount rather than trust the counts the model reports
+            result['summary'] = {
+                **(result.get('summary') or {}),
+                **summarize_findings(result.get('findings', []))
+            }
+
             # Add metadata
             result['analysis_metadata'] = {
                 'timestamp': datetime.utcnow().isoformat(),
@@ -124,6 +177,117 @@ class UnifiedContractAgent:
                 'raw_response': response.content
             }
 
+    async def analyze_contract_batched(
+        self,
+        contract_text: str,
+        policies: List[Dict],
+        clause_metadata: Optional[List[Dict]] = None,
+        max_concurrency: Optional[int] = None,
+        on_batch_complete: Optional[Callable[[int, int, Dict], None]] = None
+    ) -> Dict:
+        """
+        Analyze the contract against policies in concurrent batches
+
+        Lifts the policy cap a single call needs to avoid timeouts: policies
+        are split into POLICY_BATCH_SIZE groups, each checked in its own call,
+        and the findings merged into one result.
+
+        Args:
+            contract_text: Full contract text
+            policies: List of policy dicts with policy_id, title, requirement
+            clause_metadata: Optional pre-extracted clause boundaries
+            max_concurrency: Max calls in flight (default settings.LLM_MAX_CONCURRENCY)
+            on_batch_complete: Optional callback(batch_number, batch_count, result),
+                called as each batch finishes so callers can show findings early
+
+        Returns:
+            Analysis result in the same shape as analyze_contract
+        """
+        batches = [
+            policies[i:i + self.POLICY_BATCH_SIZE]
+            for i in range(0, len(policies), self.POLICY_BATCH_SIZE)
+        ]
+        if len(batches) <= 1:
+            result = await self.analyze_contract(contract_text, policies, clause_metadata)
+            if on_batch_complete:
+                on_batch_complete(1, 1, result)
+            return result
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.LLM_MAX_CONCURRENCY)
+
+        async def analyze_batch(number, batch):
+            async with semaphore:
+                result = await self.analyze_contract(contract_text, batch, clause_metadata)
+            if on_batch_complete:
+                on_batch_complete(number, len(batches), result)
+            return result
+
+        results = await asyncio.gather(
+            *(analyze_batch(number, batch) for number, batch in enumerate(batches, start=1)),
+            return_exceptions=True
+        )
+
+        return self._merge_batch_results(results, contract_text, len(policies))
+
+    def _merge_batch_results(self, results: List, contract_text: str, policies_checked: int) -> Dict:
+        """Combine per-batch results, recomputing the summary over all findings"""
+        findings = []
+        key_themes = []
+        errors = []
+        seen_ids = set()
+
+        for index, result in enumerate(results, start=1):
+            if isinstance(result, Exception):
+                errors.append(f"Policy batch {index} failed: {result}")
+                continue
+            if result.get('error'):
+                errors.append(f"Policy batch {index}: {result['error']}")
+
+            for finding in result.get('findings', []):
+                # Each call numbers its own findings, so ids can collide
+                finding_id = finding.get('finding_id')
+                if finding_id in seen_ids:
+                    renamed = f"{finding_id}-b{index}"
+                    suffix = 1
+                    while renamed in seen_ids:
+                        suffix += 1
+                        renamed = f"{finding_id}-b{index}-{suffix}"
+                    finding['finding_id'] = finding_id = renamed
+                seen_ids.add(finding_id)
+                findings.append(finding)
+
+            for theme in result.get('summary', {}).get('key_themes', []):
+                if theme not in key_themes:
+                    key_themes.append(theme)
+
+        scored = []
+        for finding in findings:
+            risk = finding.get('risk_score') or {}
+            if isinstance(risk.get('overall_score'), (int, float)):
+                scored.append((risk['overall_score'], finding.get('finding_id')))
+
+        merged = {
+            'findings': findings,
+            'summary': {
+                **summarize_findings(findings),
+                'key_themes': key_themes,
+                'average_risk_score': round(sum(score for score, _ in scored) / len(scored), 1) if scored else 0.0,
+                'highest_risk_finding': max(scored, key=lambda item: item[0])[1] if scored else None
+            },
+            'analysis_metadata': {
+                'timestamp': datetime.utcnow().isoformat(),
+                'style_params': self.style_params,
+                'model': 'gpt-4o-mini',
+                'contract_length': len(contract_text),
+                'policies_checked': policies_checked,
+                'policy_batches': len(results)
+            }
+        }
+        if errors:
+            merged['errors'] = errors
+
+        return merged
+
     def _build_system_prompt(self) -> str:
         """Build system prompt with personality and instructions"""
 
@@ -303,17 +467,12 @@ Analyze the contract above. Return JSON with findings and suggested edits."""
 
     def get_stats(self, analysis_result: Dict) -> Dict:
         """Extract statistics from analysis result"""
-        findings = analysis_result.get('findings', [])
+        summary = summarize_findings(analysis_result.get('findings', []))
 
         return {
-            'total_findings': len(findings),
-            'with_edits': sum(1 for f in findings if f.get('suggested_edit')),
-            'by_severity': {
-                'critical': sum(1 for f in findings if f.get('severity') == 'critical'),
-                'high': sum(1 for f in findings if f.get('severity') == 'high'),
-                'medium': sum(1 for f in findings if f.get('severity') == 'medium'),
-                'low': sum(1 for f in findings if f.get('severity') == 'low')
-            },
+            'total_findings': summary['total_findings'],
+            'with_edits': summary['total_suggested_edits'],
+            'by_severity': summary['by_severity'],
             'style_params': self.style_params,
             'timestamp': analysis_result.get('analysis_metadata', {}).get('timestamp')
         }
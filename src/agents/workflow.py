@@ -15,6 +15,7 @@ Uses LangGraph StateGraph for orchestration with built-in:
 
 from typing import Dict, List, Optional
 from datetime import datetime
+from collections import Counter
 import json
 
 from langgraph.graph import StateGraph, END
@@ -208,10 +209,7 @@ class ContractAnalysisWorkflow:
         edits = state.get('suggested_edits', [])
 
         # Count by severity
-        severity_counts = {}
-        for finding in findings:
-            severity = finding.get('severity', 'unknown')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts = dict(Counter(finding.get('severity', 'unknown') for finding in findings))
 
         # Count conflicts
         conflict_count = sum(
@@ -2,7 +2,7 @@
 
 from .project_memory import ProjectMemory
 from .task_manager import TaskManager, Task
-from .adaptive_controller import AdaptiveOrchestrator, AgentTaskResult
+from .adaptive_controller import AdaptiveOrchestrator, AgentTaskResult, TaskProgress
 
 __all__ = [
     "ProjectMemory",
@@ -10,4 +10,5 @@ __all__ = [
     "Task",
     "AdaptiveOrchestrator",
     "AgentTaskResult",
+    "TaskProgress",
 ]
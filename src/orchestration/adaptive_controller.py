@@ -5,8 +5,10 @@ from __future__ import annotations
 import asyncio
 import difflib
 import hashlib
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from src.agents.state import AnalysisContext, create_initial_context
 from src.orchestration.project_memory import ProjectMemory
@@ -33,6 +35,17 @@ class AgentTaskResult:
     new_tasks: Sequence[Dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass
+class TaskProgress:
+    """Snapshot emitted by ``run_streaming`` after each task is handled."""
+
+    task_type: str
+    agent_name: Optional[str]
+    status: str
+    context: Optional[AnalysisContext] = None
+    error: Optional[str] = None
+
+
 class AgentAdapter:
     """Adapter around existing workflow agents with task routing metadata."""
 
@@ -53,6 +66,55 @@ class AgentAdapter:
         return await self._process(context)
 
 
+@lru_cache(maxsize=1)
+def _default_agents() -> Tuple[AgentAdapter, ...]:
+    """Create adapters for the existing four agents when available.
+
+    Built once per process and shared by every orchestrator (e.g. one per
+    Streamlit session): the agents keep no per-run state, so reusing them
+    reuses their LLM clients and the HTTP connection pools behind them.
+    """
+
+    adapters: List[AgentAdapter] = []
+    if DiligentReviewerAgent:
+        reviewer = DiligentReviewerAgent()
+        adapters.append(
+            AgentAdapter(
+                name="DiligentReviewer",
+                supported_tasks=["clause_review"],
+                process_fn=reviewer.process,
+            )
+        )
+    if NeutralRationaleAgent:
+        rationale = NeutralRationaleAgent()
+        adapters.append(
+            AgentAdapter(
+                name="NeutralRationale",
+                supported_tasks=["neutral_rationale"],
+                process_fn=rationale.process,
+            )
+        )
+    if PersonalityAgent:
+        personality = PersonalityAgent()
+        adapters.append(
+            AgentAdapter(
+                name="Personality",
+                supported_tasks=["style_pass"],
+                process_fn=personality.process,
+            )
+        )
+    if EditorAgent:
+        editor = EditorAgent()
+        adapters.append(
+            AgentAdapter(
+                name="Editor",
+                supported_tasks=["editor_pass"],
+                process_fn=editor.process,
+            )
+        )
+    return tuple(adapters)
+
+
 class AdaptiveOrchestrator:
     """Coordinates agents using shared project memory and dynamic task queues."""
 
@@ -64,7 +126,7 @@ class AdaptiveOrchestrator:
     ) -> None:
         self.memory = project_memory or ProjectMemory()
         self.tasks = task_manager or TaskManager()
-        self.agents = list(agents or self._build_default_agents())
+        self.agents = list(agents or _default_agents())
 
     # ------------------------------------------------------------------
     # Public API
@@ -81,6 +143,7 @@ class AdaptiveOrchestrator:
         graph_snapshot: Optional[str] = None,
         preferences: Optional[Dict[str, Any]] = None,
         style_params: Optional[Dict[str, Any]] = None,
+        max_llm_concurrency: Optional[int] = None,
     ) -> str:
         """Register a new contract version and seed initial tasks."""
 
@@ -115,6 +178,7 @@ class AdaptiveOrchestrator:
             clauses=clauses,
             policies=policies,
             style_params=style_params,
+            max_llm_concurrency=max_llm_concurrency,
         )
         self.memory.store_context(context_id, context)
 
@@ -143,6 +207,12 @@ class AdaptiveOrchestrator:
     async def run(self, max_iterations: int = 25) -> None:
         """Process queued tasks until exhausted or iteration limit reached."""
 
+        async for _ in self.run_streaming(max_iterations=max_iterations):
+            pass
+
+    async def run_streaming(self, max_iterations: int = 25) -> AsyncIterator[TaskProgress]:
+        """Like ``run`` but yields progress after every task so callers can render partial results."""
+
         iterations = 0
         while iterations < max_iterations:
             task = self.tasks.dequeue()
@@ -153,12 +223,14 @@ class AdaptiveOrchestrator:
             if not agent:
                 self.tasks.mark_complete(task.task_id, {"error": "no_agent"})
                 iterations += 1
+                yield TaskProgress(task.task_type, None, "skipped", error="no_agent")
                 continue
 
             context = self._load_context(task)
             if context is None:
                 self.tasks.mark_complete(task.task_id, {"error": "missing_context"})
                 iterations += 1
+                yield TaskProgress(task.task_type, agent.name, "skipped", error="missing_context")
                 continue
 
             try:
@@ -185,6 +257,7 @@ class AdaptiveOrchestrator:
                         depends_on=spec.get("depends_on"),
                     )
                 self.tasks.mark_complete(task.task_id, {"status": result.status})
+                progress = TaskProgress(task.task_type, agent.name, result.status, context=updated_context)
             except Exception as exc:  # pragma: no cover - defensive logging
                 self.memory.log_agent_event(
                     project_id=task.payload["project_id"],
@@ -194,7 +267,9 @@ class AdaptiveOrchestrator:
                     payload={"task_type": task.task_type, "error": str(exc)},
                 )
                 self.tasks.mark_complete(task.task_id, {"error": str(exc)})
+                progress = TaskProgress(task.task_type, agent.name, "error", error=str(exc))
             iterations += 1
+            yield progress
 
     def get_context(self, context_id: str) -> Optional[AnalysisContext]:
         stored = self.memory.get_context(context_id)
@@ -276,10 +351,9 @@ class AdaptiveOrchestrator:
         rationales = context.get("neutral_rationales", [])
         edits = context.get("suggested_edits", [])
 
-        severity_counts: Dict[str, int] = {}
-        for finding in findings:
-            severity = str(finding.get("severity", "unknown")).lower()
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts: Dict[str, int] = dict(
+            Counter(str(finding.get("severity", "unknown")).lower() for finding in findings)
+        )
 
         conflict_count = sum(
             1 for edit in edits if edit.get("conflicts_with")
@@ -297,48 +371,6 @@ class AdaptiveOrchestrator:
             "has_errors": len(context.get("errors", [])) > 0,
         }
 
-    def _build_default_agents(self) -> List[AgentAdapter]:
-        """Create adapters for the existing four agents when available."""
-
-        adapters: List[AgentAdapter] = []
-        if DiligentReviewerAgent:
-            reviewer = DiligentReviewerAgent()
-            adapters.append(
-                AgentAdapter(
-                    name="DiligentReviewer",
-                    supported_tasks=["clause_review"],
-                    process_fn=reviewer.process,
-                )
-            )
-        if NeutralRationaleAgent:
-            rationale = NeutralRationaleAgent()
-            adapters.append(
-                AgentAdapter(
-                    name="NeutralRationale",
-                    supported_tasks=["neutral_rationale"],
-                    process_fn=rationale.process,
-                )
-            )
-        if PersonalityAgent:
-            personality = PersonalityAgent()
-            adapters.append(
-                AgentAdapter(
-                    name="Personality",
-                    supported_tasks=["style_pass"],
-                    process_fn=personality.process,
-                )
-            )
-        if EditorAgent:
-            editor = EditorAgent()
-            adapters.append(
-                AgentAdapter(
-                    name="Editor",
-                    supported_tasks=["editor_pass"],
-                    process_fn=editor.process,
-                )
-            )
-        return adapters
-
     # Convenience for synchronous contexts
     def run_sync(self, max_iterations: int = 25) -> None:
         asyncio.run(self.run(max_iterations=max_iterations))
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -51,6 +52,13 @@ class ProjectMemory:
         self.base_path = base_path or Path("project_memory")
         self.base_path.mkdir(parents=True, exist_ok=True)
         self._live_contexts: Dict[str, Dict[str, Any]] = {}
+        # Parsed project files keyed by id, tagged with the file's mtime so
+        # repeated reads (e.g. every Streamlit rerun) skip re-parsing
+        self._project_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # Bumped whenever a project is loaded from disk or saved, so derived
+        # views (grouped events) know when to rebuild
+        self._project_generation: Dict[str, int] = {}
+        self._grouped_events_cache: Dict[str, Tuple[int, Dict[str, List[Dict[str, Any]]]]] = {}
 
     # ------------------------------------------------------------------
     # Version history
@@ -146,6 +154,24 @@ class ProjectMemory:
         project = self._load_project(project_id)
         return project.get("agent_events", [])
 
+    def get_agent_events_grouped(self, project_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Agent events keyed by version_id, rebuilt only when the project file changes.
+
+        The returned dict is shared between calls - treat it as read-only.
+        """
+
+        project = self._load_project(project_id)
+        generation = self._project_generation.get(project_id, 0)
+        cached = self._grouped_events_cache.get(project_id)
+        if cached and cached[0] == generation:
+            return cached[1]
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for event in project.get("agent_events", []):
+            grouped.setdefault(event.get("version_id", ""), []).append(event)
+        self._grouped_events_cache[project_id] = (generation, grouped)
+        return grouped
+
     def get_latest_contract_text(self, project_id: str) -> Optional[str]:
         project = self._load_project(project_id)
         return project.get("latest_contract_text")
@@ -171,14 +197,27 @@ class ProjectMemory:
         return self.base_path / f"{project_id}.json"
 
     def _load_project(self, project_id: str) -> Dict[str, Any]:
+        """Project data as a private copy, so callers can't corrupt the cache by mutating it."""
         file_path = self._project_file(project_id)
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return {"project_id": project_id, "versions": [], "preferences": {}, "agent_events": []}
+
+        cached = self._project_cache.get(project_id)
+        if cached and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+
         try:
-            return json.loads(file_path.read_text())
+            data = json.loads(file_path.read_text())
         except json.JSONDecodeError:
             return {"project_id": project_id, "versions": [], "preferences": {}, "agent_events": []}
+        self._project_cache[project_id] = (mtime_ns, data)
+        self._project_generation[project_id] = self._project_generation.get(project_id, 0) + 1
+        return copy.deepcopy(data)
 
     def _save_project(self, project_id: str, data: Dict[str, Any]) -> None:
         file_path = self._project_file(project_id)
         file_path.write_text(json.dumps(data, indent=2, sort_keys=True))
+        self._project_cache[project_id] = (file_path.stat().st_mtime_ns, data)
+        self._project_generation[project_id] = self._project_generation.get(project_id, 0) + 1
@@ -9,8 +9,11 @@ except ImportError:
     CacheService = None
 
 from .embedding_service import EmbeddingService
+from .llm_cache import CachedLLMClient, llm_retries
 
 __all__ = [
     "CacheService",
     "EmbeddingService",
+    "CachedLLMClient",
+    "llm_retries",
 ]
@@ -12,6 +12,10 @@ from sentence_transformers import SentenceTransformer
 from config.settings import settings
 
 
+# Texts per model forward pass in generate_embeddings_batch
+EMBEDDING_BATCH_SIZE = 64
+
+
 class EmbeddingService:
     """
     Service for generating and managing semantic embeddings
@@ -77,7 +81,9 @@ class EmbeddingService:
             List of embedding vectors
         """
         self._load_model()
-        embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
+        embeddings = self.embedding_model.encode(
+            texts, batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True
+        )
         return embeddings.tolist()
 
     def add_policy_embedding(
@@ -121,32 +127,57 @@ class EmbeddingService:
         Returns:
             List of similar policies with scores
         """
+        return self.search_similar_policies_batch([query_text], n_results, category)[0]
+
+    def search_similar_policies_batch(
+        self, query_texts: List[str], n_results: int = 5, category: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Find policies similar to each of several query texts
+
+        Embeds all queries in one model call and searches them in one
+        collection query, instead of one round of each per text.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per query
+            category: Optional category filter
+
+        Returns:
+            One list of similar policies with scores per query, in order
+        """
+        if not query_texts:
+            return []
+
         self._init_chroma()
 
-        query_embedding = self.generate_embedding(query_text)
+        query_embeddings = self.generate_embeddings_batch(query_texts)
 
         # Build where clause for filtering
         where = {"category": category} if category else None
 
         results = self.policies_collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=where,
         )
 
         # Format results
-        similar_policies = []
-        for i, policy_id in enumerate(results["ids"][0]):
-            similar_policies.append(
-                {
-                    "policy_id": policy_id,
-                    "policy_text": results["documents"][0][i],
-                    "similarity_score": 1 - results["distances"][0][i],  # Convert distance to similarity
-                    "metadata": results["metadatas"][0][i],
-                }
-            )
+        all_similar_policies = []
+        for q, policy_ids in enumerate(results["ids"]):
+            similar_policies = []
+            for i, policy_id in enumerate(policy_ids):
+                similar_policies.append(
+                    {
+                        "policy_id": policy_id,
+                        "policy_text": results["documents"][q][i],
+                        "similarity_score": 1 - results["distances"][q][i],  # Convert distance to similarity
+                        "metadata": results["metadatas"][q][i],
+                    }
+                )
+            all_similar_policies.append(similar_policies)
 
-        return similar_policies
+        return all_similar_policies
 
     def add_rejected_clause(
         self, rejection_id: str, clause_text: str, metadata: Optional[Dict] = None
@@ -0,0 +1,229 @@
+"""
+LLM Response Cache
+Serves repeated agent prompts from a local SQLite store instead of the API
+
+Successive versions of a contract share most of their clauses, so the
+clause/policy/style prompts the agents build are mostly identical between
+runs. Responses are keyed on the exact prompt plus the model configuration
+and call options, and expire after settings.LLM_CACHE_TTL_HOURS. Callers pass
+a validate function so a response they can't parse is never stored.
+
+API calls that hit a rate limit or time out are retried with jittered
+exponential backoff, so one throttled call doesn't fail a whole analysis.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import openai
+from langchain_core.messages import AIMessage
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+try:
+    import anthropic
+except ImportError:  # pragma: no cover - optional dependency
+    anthropic = None
+
+from config.settings import settings
+
+
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError)
+if anthropic is not None:
+    RETRYABLE_ERRORS += (anthropic.RateLimitError, anthropic.APITimeoutError)
+
+# Set to a fresh list at the start of a run to collect that run's retries;
+# asyncio tasks inherit it, so every agent call in the run appends to it
+llm_retries: ContextVar[Optional[List[str]]] = ContextVar("llm_retries", default=None)
+
+
+def _record_retry(retry_state) -> None:
+    error = retry_state.outcome.exception()
+    print(f"Warning: LLM call failed with {type(error).__name__}, "
+          f"retrying (attempt {retry_state.attempt_number})")
+    retries = llm_retries.get()
+    if retries is not None:
+        retries.append(type(error).__name__)
+
+
+def parse_json_content(content: str) -> Any:
+    """Parse a JSON response, tolerating a surrounding markdown code block"""
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1] if "\n" in content else ""
+        content = content.rsplit("\n```", 1)[0]
+    return json.loads(content)
+
+
+class LLMResponseStore:
+    """
+    SQLite-backed prompt -> response store shared by all cached clients
+    """
+
+    def __init__(self, db_path: str, ttl_hours: int = 0):
+        self.db_path = db_path
+        self.ttl_hours = ttl_hours  # 0 keeps entries until overwritten
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Lazily open the database (called from worker threads)"""
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        query = "SELECT content FROM llm_responses WHERE cache_key = ?"
+        params = [key]
+        if self.ttl_hours:
+            query += " AND created_at >= datetime('now', ?)"
+            params.append(f"-{self.ttl_hours} hours")
+        with self._lock:
+            row = self._connect().execute(query, params).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (cache_key, content) VALUES (?, ?)",
+                (key, content),
+            )
+            conn.commit()
+
+
+class CachedLLMClient:
+    """
+    Drop-in wrapper for a LangChain chat model's ainvoke()
+
+    Only the response text is cached; hits come back as an AIMessage so
+    callers reading `.content` work unchanged. Cache errors never fail a call.
+
+    Retries happen here, so build the wrapped model with max_retries=0;
+    otherwise every attempt is multiplied by the SDK's own retries and
+    llm_retries under-counts them.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        store: Optional[LLMResponseStore] = None,
+        bound_kwargs: Optional[Dict] = None,
+    ):
+        self.llm = llm
+        self.store = store or llm_response_store
+        self.bound_kwargs = bound_kwargs or {}
+
+    def bind(self, **kwargs) -> "CachedLLMClient":
+        """Bind call options (e.g. max_tokens) - they become part of the key"""
+        return CachedLLMClient(
+            self.llm.bind(**kwargs),
+            store=self.store,
+            bound_kwargs={**self.bound_kwargs, **kwargs},
+        )
+
+    def _model_config(self) -> Dict:
+        llm = getattr(self.llm, "bound", self.llm)
+        return {
+            "model": getattr(llm, "model_name", None) or getattr(llm, "model", None),
+            "temperature": getattr(llm, "temperature", None),
+            "max_tokens": getattr(llm, "max_tokens", None),
+            "bound": self.bound_kwargs,
+        }
+
+    @staticmethod
+    def _prompt_text(prompt: Any) -> str:
+        """Normalize str, PromptValue or message list input to text"""
+        if isinstance(prompt, str):
+            return prompt
+        if hasattr(prompt, "to_string"):
+            return prompt.to_string()
+        return json.dumps(
+            [(getattr(m, "type", ""), getattr(m, "content", str(m))) for m in prompt],
+            ensure_ascii=False,
+        )
+
+    def cache_key(self, prompt: Any, call_kwargs: Optional[Dict] = None) -> str:
+        config = json.dumps(
+            {**self._model_config(), "call": call_kwargs or {}},
+            sort_keys=True,
+            default=str,
+        )
+        payload = f"{config}\x00{self._prompt_text(prompt)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _ainvoke_with_retry(self, prompt: Any, **kwargs) -> Any:
+        async for attempt in AsyncRetrying(
+            wait=wait_random_exponential(multiplier=1, max=30),
+            stop=stop_after_attempt(5),
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            before_sleep=_record_retry,
+            reraise=True,
+        ):
+            with attempt:
+                return await self.llm.ainvoke(prompt, **kwargs)
+
+    async def ainvoke(
+        self,
+        prompt: Any,
+        validate: Optional[Callable[[str], Any]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Invoke the model, serving and storing responses through the cache
+
+        Args:
+            prompt: Prompt passed to the wrapped model's ainvoke()
+            validate: Optional check run on the response text before it is
+                cached (e.g. parse_json_content); if it raises, the response
+                is still returned but not stored
+            **kwargs: Call options for the model - part of the cache key
+        """
+        if not settings.LLM_CACHE_ENABLED:
+            return await self._ainvoke_with_retry(prompt, **kwargs)
+
+        key = self.cache_key(prompt, kwargs)
+        try:
+            cached = await asyncio.to_thread(self.store.get, key)
+        except Exception:
+            cached = None
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        response = await self._ainvoke_with_retry(prompt, **kwargs)
+        if isinstance(response.content, str):
+            if validate is not None:
+                try:
+                    validate(response.content)
+                except Exception:
+                    return response  # Don't replay an unusable answer on later runs
+            try:
+                await asyncio.to_thread(self.store.set, key, response.content)
+            except Exception:
+                pass  # Caching is best effort
+        return response
+
+
+# Global store instance
+llm_response_store = LLMResponseStore(settings.LLM_CACHE_PATH, settings.LLM_CACHE_TTL_HOURS)
@@ -259,6 +259,19 @@ class NegotiationTracker:
 
         return timeline
 
+    def get_last_modified(self, negotiation_id: str) -> Optional[int]:
+        """
+        Modification time (ns) of the negotiation record, None if it doesn't exist
+
+        Every add_version rewrites the record, so this changes whenever a version
+        is added - from any session or process.
+        """
+        path = self.storage_dir / f"{negotiation_id}_negotiation.json"
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     def list_negotiations(self) -> List[Dict]:
         """List all negotiations"""
         negotiations = []
@@ -0,0 +1,7 @@
+"""Lightweight helpers with no third-party dependencies"""
+
+from .text import count_words
+
+__all__ = [
+    "count_words",
+]
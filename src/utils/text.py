@@ -0,0 +1,15 @@
+"""Dependency-free text helpers shared by the CLI scripts and the Streamlit apps"""
+
+
+# Maps ASCII whitespace to b' ' and every other byte to b'x', so words can be
+# counted as " x" transitions in C without building a list of tokens
+_WORD_MARKS = bytes(
+    0x20 if byte in b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f' else 0x78
+    for byte in range(256)
+)
+
+
+def count_words(text: str) -> int:
+    """Word count equivalent to len(text.split()) for ASCII whitespace, without the list"""
+    marks = b' ' + text.encode('utf-8').translate(_WORD_MARKS)
+    return marks.count(b' x')
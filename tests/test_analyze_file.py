@@ -0,0 +1,196 @@
+"""
+Tests for contract chunking, clause extraction and the on-disk caches in analyze_file
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+analyze_file = pytest.importorskip("analyze_file")
+
+
+class StubLLM:
+    """Stands in for the extraction client; answers from a callable"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.prompts = []
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=self.respond(prompt))
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyze_file, "CLAUSE_CACHE_DIR", tmp_path / "clauses")
+    monkeypatch.setattr(analyze_file, "TEXT_CACHE_DIR", tmp_path / "text")
+
+
+# =============================================================================
+# CHUNKING
+# =============================================================================
+
+def test_chunk_at_exact_limit_is_not_split():
+    max_chars = analyze_file.MAX_CHUNK_CHARS
+    text = "a" * max_chars
+    assert analyze_file._chunk_contract(text) == [text]
+
+    # Two paragraphs whose joined length is exactly the limit
+    half = (max_chars - 2) // 2
+    text = "a" * half + "\n\n" + "b" * (max_chars - 2 - half)
+    assert analyze_file._chunk_contract(text) == [text]
+
+
+def test_chunk_one_over_limit_splits_on_paragraph():
+    max_chars = analyze_file.MAX_CHUNK_CHARS
+    first, second = "a" * (max_chars // 2), "b" * (max_chars // 2)
+    assert analyze_file._chunk_contract(first + "\n\n" + second) == [first, second]
+
+
+def test_oversized_paragraph_is_hard_split():
+    max_chars = analyze_file.MAX_CHUNK_CHARS
+    chunks = analyze_file._chunk_contract("intro\n\n" + "x" * (2 * max_chars))
+    assert chunks == ["intro", "x" * max_chars, "x" * max_chars]
+
+
+def test_chunks_never_exceed_limit_and_keep_text():
+    text = "\n\n".join("p" * size for size in (10, 3000, 9000, 150, 12000, 40, 25000, 7))
+    chunks = analyze_file._chunk_contract(text)
+    assert all(len(chunk) <= analyze_file.MAX_CHUNK_CHARS for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
+
+
+# =============================================================================
+# PARALLEL EXTRACTION
+# =============================================================================
+
+def _marker_response(prompt):
+    """One clause per chunk, named after the paragraph letter it contains"""
+    clauses = [
+        {"clause_identifier": f"Section {letter}", "clause_type": "SLA",
+         "clause_text": letter, "confidence": 0.9}
+        for letter in "ABC" if letter * 100 in prompt
+    ]
+    return "```json\n" + json.dumps(clauses) + "\n```"
+
+
+def _three_chunk_contract():
+    size = analyze_file.MAX_CHUNK_CHARS * 2 // 3
+    return "\n\n".join(letter * size for letter in "ABC")
+
+
+def test_extracts_each_chunk_in_order(monkeypatch):
+    llm = StubLLM(_marker_response)
+    monkeypatch.setattr(analyze_file, "_get_extraction_llm", lambda: llm)
+
+    clauses = asyncio.run(analyze_file.extract_clauses_with_llm(_three_chunk_contract()))
+
+    assert len(llm.prompts) == 3
+    assert [c["clause_text"] for c in clauses] == ["A", "B", "C"]
+    assert [c["clause_id"] for c in clauses] == ["clause-1", "clause-2", "clause-3"]
+    assert {c["clause_type"] for c in clauses} == {"service_levels"}
+
+
+def test_failed_chunk_keeps_other_results(monkeypatch):
+    def respond(prompt):
+        return "not json" if "B" * 100 in prompt else _marker_response(prompt)
+
+    monkeypatch.setattr(analyze_file, "_get_extraction_llm", lambda: StubLLM(respond))
+
+    clauses = asyncio.run(analyze_file.extract_clauses_with_llm(_three_chunk_contract()))
+
+    assert [c["clause_text"] for c in clauses] == ["A", "C"]
+
+
+# =============================================================================
+# CLAUSE CACHE
+# =============================================================================
+
+def _failing_llm():
+    def respond(prompt):
+        raise AssertionError("LLM called despite a cached result")
+    return StubLLM(respond)
+
+
+def test_clause_cache_serves_repeat_extraction(monkeypatch):
+    contract = _three_chunk_contract()
+    monkeypatch.setattr(analyze_file, "_get_extraction_llm", lambda: StubLLM(_marker_response))
+    first = asyncio.run(analyze_file.extract_clauses_with_llm(contract))
+
+    monkeypatch.setattr(analyze_file, "_get_extraction_llm", _failing_llm)
+    second = asyncio.run(analyze_file.extract_clauses_with_llm(contract))
+
+    assert second == first
+
+
+def test_clause_cache_is_keyed_on_contract_type():
+    contract = "Some contract text"
+    assert (analyze_file._clause_cache_path(contract, "saas")
+            != analyze_file._clause_cache_path(contract, "professional_services"))
+    assert (analyze_file._clause_cache_path(contract, "saas")
+            == analyze_file._clause_cache_path(contract, "saas"))
+
+
+def test_partial_extraction_is_not_cached(monkeypatch):
+    def respond(prompt):
+        return "not json" if "B" * 100 in prompt else _marker_response(prompt)
+
+    contract = _three_chunk_contract()
+    monkeypatch.setattr(analyze_file, "_get_extraction_llm", lambda: StubLLM(respond))
+    asyncio.run(analyze_file.extract_clauses_with_llm(contract))
+
+    assert not analyze_file._clause_cache_path(contract, "saas").exists()
+
+
+def test_corrupt_clause_cache_is_a_miss(tmp_path):
+    cache_path = tmp_path / "broken.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+    assert analyze_file._read_clause_cache(cache_path) is None
+    assert analyze_file._read_clause_cache(tmp_path / "missing.json") is None
+
+
+# =============================================================================
+# TEXT CACHE
+# =============================================================================
+
+@pytest.fixture
+def counted_docx_parser(monkeypatch):
+    calls = []
+
+    def parse_docx(file_path):
+        calls.append(file_path)
+        return f"parsed text #{len(calls)}"
+
+    monkeypatch.setattr(analyze_file, "parse_docx", parse_docx)
+    return calls
+
+
+def test_text_cache_skips_reparsing_unchanged_file(tmp_path, counted_docx_parser):
+    document = tmp_path / "contract.docx"
+    document.write_bytes(b"docx bytes")
+
+    assert analyze_file.parse_document(str(document)) == "parsed text #1"
+    assert analyze_file.parse_document(str(document)) == "parsed text #1"
+    assert len(counted_docx_parser) == 1
+
+
+def test_text_cache_misses_after_file_changes(tmp_path, counted_docx_parser):
+    document = tmp_path / "contract.docx"
+    document.write_bytes(b"docx bytes")
+    analyze_file.parse_document(str(document))
+
+    document.write_bytes(b"edited docx bytes")
+
+    assert analyze_file.parse_document(str(document)) == "parsed text #2"
+    assert len(counted_docx_parser) == 2
+
+
+def test_plain_text_is_not_cached(tmp_path):
+    document = tmp_path / "contract.txt"
+    document.write_text("Plain contract", encoding="utf-8")
+
+    assert analyze_file.parse_document(str(document)) == "Plain contract"
+    assert not analyze_file.TEXT_CACHE_DIR.exists()
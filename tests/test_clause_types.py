@@ -0,0 +1,70 @@
+"""
+Tests for clause type normalization and policy matching
+"""
+
+import asyncio
+
+import pytest
+
+analyze_file = pytest.importorskip("analyze_file")
+normalize_clause_type = analyze_file.normalize_clause_type
+
+
+def test_synonyms_map_to_canonical_type():
+    assert normalize_clause_type('SLA') == 'service_levels'
+    assert normalize_clause_type('Limitation-of-Liabilities') == 'limitation_of_liability'
+    assert normalize_clause_type(' indemnification ') == 'indemnity'
+
+
+def test_policy_vocabulary_passes_through():
+    # Categories used by policies/playbook rules must not be remapped
+    for clause_type in ('dispute_resolution', 'fees', 'pricing', 'security',
+                        'subprocessors', 'termination_for_cause', 'uptime_sla'):
+        assert normalize_clause_type(clause_type) == clause_type
+
+
+def test_unknown_type_is_kept():
+    assert normalize_clause_type('Most Favoured Nation') == 'most_favoured_nation'
+
+
+def test_missing_type_is_other():
+    assert normalize_clause_type(None) == 'other'
+    assert normalize_clause_type('') == 'other'
+
+
+def _reviewer():
+    diligent_reviewer = pytest.importorskip("src.agents.diligent_reviewer")
+    DiligentReviewerAgent = diligent_reviewer.DiligentReviewerAgent
+    # _get_relevant_policies needs no LLM client
+    return object.__new__(DiligentReviewerAgent)
+
+
+POLICIES = [
+    {'policy_id': 'p1', 'policy_category': 'dispute_resolution', 'source': 'policy'},
+    {'policy_id': 'p2', 'policy_category': 'governing_law', 'source': 'policy'},
+    {'policy_id': 'r1', 'policy_category': None, 'source': 'playbook_rule',
+     'applicable_clauses': ['pricing', 'fees']},
+]
+
+
+@pytest.mark.parametrize('raw_type, expected_ids', [
+    ('Dispute Resolution', ['p1']),
+    ('pricing', ['r1']),
+])
+def test_typed_clause_reaches_its_policies(raw_type, expected_ids):
+    reviewer = _reviewer()
+    clause = {'clause_type': normalize_clause_type(raw_type), 'clause_text': '...'}
+
+    relevant = asyncio.run(reviewer._get_relevant_policies(clause, POLICIES))
+
+    assert [p['policy_id'] for p in relevant] == expected_ids
+
+
+def test_other_clause_uses_semantic_matches():
+    reviewer = _reviewer()
+    similar = [{'policy_id': 'p2'}]
+    clause = {'clause_type': normalize_clause_type(None), 'clause_text': '...'}
+
+    relevant = asyncio.run(reviewer._get_relevant_policies(clause, POLICIES, similar))
+
+    assert relevant == similar
@@ -0,0 +1,146 @@
+"""
+Tests for DiligentReviewerAgent batching and clause dedupe, with stubbed LLM clients
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+diligent_reviewer = pytest.importorskip("src.agents.diligent_reviewer")
+DiligentReviewerAgent = diligent_reviewer.DiligentReviewerAgent
+
+from src.agents.state import create_initial_context
+
+
+DEVIATION = {
+    "has_deviation": True,
+    "deviation_type": "excessive_value",
+    "severity": "medium",
+    "evidence_quote": "quote",
+    "explanation": "explanation",
+}
+
+
+class StubLLM:
+    """Records prompts and tracks how many calls are in flight at once"""
+
+    def __init__(self, respond, tracker):
+        self.respond = respond
+        self.tracker = tracker
+        self.prompts = []
+
+    async def ainvoke(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        self.tracker["in_flight"] += 1
+        self.tracker["max_in_flight"] = max(self.tracker["max_in_flight"], self.tracker["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(content=self.respond(prompt))
+        finally:
+            self.tracker["in_flight"] -= 1
+
+
+def _reviewer(batch_respond, single_respond=lambda prompt: json.dumps(DEVIATION)):
+    tracker = {"in_flight": 0, "max_in_flight": 0}
+    reviewer = object.__new__(DiligentReviewerAgent)
+    reviewer.llm = StubLLM(single_respond, tracker)
+    reviewer.batch_llm = StubLLM(batch_respond, tracker)
+    return reviewer, tracker
+
+
+def _pair(n):
+    clause = {"clause_id": f"c{n}", "clause_type": "payment_terms", "clause_text": f"Clause text {n}"}
+    policy = {"policy_id": f"p{n}", "policy_text": f"Policy {n}", "policy_category": "payment_terms",
+              "source": "policy"}
+    return clause, policy
+
+
+# =============================================================================
+# BATCHED COMPLIANCE CHECKS
+# =============================================================================
+
+def test_batch_results_matched_by_id_not_position():
+    def respond(prompt):
+        # Out of order, and check 2 is compliant
+        return json.dumps([{"id": 3, **DEVIATION}, {"id": 2, "has_deviation": False}, {"id": 1, **DEVIATION}])
+
+    reviewer, _ = _reviewer(respond)
+    pairs = [_pair(n) for n in (1, 2, 3)]
+
+    results = asyncio.run(reviewer._check_policy_compliance_batch(pairs, "v1", asyncio.Semaphore(4)))
+
+    assert [r and r["clause_id"] for r in results] == ["c1", None, "c3"]
+    assert reviewer.llm.prompts == []
+
+
+def test_missing_ids_are_rechecked_individually():
+    reviewer, _ = _reviewer(lambda prompt: json.dumps([{"id": 2, "has_deviation": False}]))
+    pairs = [_pair(n) for n in (1, 2, 3)]
+
+    results = asyncio.run(reviewer._check_policy_compliance_batch(pairs, "v1", asyncio.Semaphore(4)))
+
+    assert [r and r["clause_id"] for r in results] == ["c1", None, "c3"]
+    assert len(reviewer.llm.prompts) == 2
+
+
+def test_invalid_batch_json_falls_back_for_every_pair():
+    reviewer, _ = _reviewer(lambda prompt: "not json")
+    pairs = [_pair(n) for n in (1, 2)]
+
+    results = asyncio.run(reviewer._check_policy_compliance_batch(pairs, "v1", asyncio.Semaphore(4)))
+
+    assert [r["clause_id"] for r in results] == ["c1", "c2"]
+    assert len(reviewer.llm.prompts) == 2
+
+
+def test_rechecks_respect_concurrency_limit():
+    reviewer, tracker = _reviewer(lambda prompt: "[]")
+    pairs = [_pair(n) for n in range(1, 6)]
+
+    asyncio.run(reviewer._check_policy_compliance_batch(pairs, "v1", asyncio.Semaphore(1)))
+
+    assert len(reviewer.llm.prompts) == 5
+    assert tracker["max_in_flight"] == 1
+
+
+# =============================================================================
+# CLAUSE DEDUPE
+# =============================================================================
+
+def test_pair_content_key_ignores_case_and_whitespace():
+    clause, policy = _pair(1)
+    variant = {**clause, "clause_id": "other", "clause_text": "  CLAUSE   text\n1 "}
+    other_policy = {**policy, "policy_id": "p2"}
+
+    key = DiligentReviewerAgent._pair_content_key(clause, policy)
+    assert DiligentReviewerAgent._pair_content_key(variant, policy) == key
+    assert DiligentReviewerAgent._pair_content_key(clause, other_policy) != key
+    assert DiligentReviewerAgent._pair_content_key({**clause, "clause_text": "Clause text 2"}, policy) != key
+
+
+def test_copied_finding_gets_own_id_clause_and_provenance():
+    finding = {"finding_id": "f1", "clause_id": "c1", "severity": "high",
+               "provenance": {"retrieval_sources": ["p1"]}}
+
+    copy = DiligentReviewerAgent._copy_finding_for_clause(finding, {"clause_id": "c2"})
+
+    assert copy["finding_id"] != "f1"
+    assert copy["clause_id"] == "c2"
+    assert copy["severity"] == "high"
+    copy["provenance"]["confidence_score"] = 0.5
+    assert "confidence_score" not in finding["provenance"]
+
+
+def test_identical_clauses_are_checked_once():
+    reviewer, _ = _reviewer(lambda prompt: "[]")
+    clause, policy = _pair(1)
+    clauses = [clause, {**clause, "clause_id": "c1-copy", "clause_text": "clause  TEXT 1"}]
+    state = create_initial_context("v1", "s1", "", clauses, [policy], max_llm_concurrency=2)
+
+    state = asyncio.run(reviewer.process(state))
+
+    assert len(reviewer.llm.prompts) == 1
+    assert sorted(f["clause_id"] for f in state["findings"]) == ["c1", "c1-copy"]
+    assert len({f["finding_id"] for f in state["findings"]}) == 2
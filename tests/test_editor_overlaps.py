@@ -0,0 +1,66 @@
+"""
+Tests for EditorAgent conflict detection
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from src.agents.editor import EditorAgent
+
+
+@pytest.fixture
+def editor():
+    # Range helpers need no LLM client
+    return object.__new__(EditorAgent)
+
+
+def _all_pairs_overlapping(editor, edits):
+    """Reference all-pairs check the sweep replaced"""
+    pairs = set()
+    for i, j in combinations(range(len(edits)), 2):
+        for start1, end1 in editor._get_edit_ranges(edits[i]):
+            for start2, end2 in editor._get_edit_ranges(edits[j]):
+                if not (end1 <= start2 or end2 <= start1):
+                    pairs.add((i, j))
+    return pairs
+
+
+def _edit(deletions=(), insertions=()):
+    return {
+        'deletions': [{'start_char': s, 'end_char': e} for s, e in deletions],
+        'insertions': [{'position_char': p} for p in insertions],
+    }
+
+
+def test_touching_ranges_do_not_overlap(editor):
+    edits = [_edit(deletions=[(0, 5)]), _edit(deletions=[(5, 9)]), _edit(insertions=[9])]
+    assert editor._overlapping_edit_pairs(edits) == set()
+
+
+def test_multi_range_edits(editor):
+    edits = [
+        _edit(deletions=[(0, 3), (20, 25)]),
+        _edit(deletions=[(10, 12)], insertions=[22]),
+        _edit(deletions=[(3, 10)], insertions=[12]),
+    ]
+    assert editor._overlapping_edit_pairs(edits) == {(0, 1)}
+    assert editor._overlapping_edit_pairs(edits) == _all_pairs_overlapping(editor, edits)
+
+
+def test_matches_all_pairs_check(editor):
+    rng = random.Random(1234)
+    for _ in range(500):
+        edits = []
+        for _ in range(rng.randint(2, 6)):
+            deletions = []
+            for _ in range(rng.randint(0, 3)):
+                start = rng.randint(0, 40)
+                deletions.append((start, start + rng.randint(0, 8)))
+            insertions = [rng.randint(0, 48) for _ in range(rng.randint(0, 2))]
+            edits.append(_edit(deletions, insertions))
+
+        assert editor._overlapping_edit_pairs(edits) == _all_pairs_overlapping(editor, edits)
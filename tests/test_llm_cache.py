@@ -0,0 +1,75 @@
+"""
+Tests for CachedLLMClient keying, validation and expiry, with a stubbed chat model
+"""
+
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+llm_cache = pytest.importorskip("src.services.llm_cache")
+CachedLLMClient = llm_cache.CachedLLMClient
+LLMResponseStore = llm_cache.LLMResponseStore
+
+
+class StubChatModel:
+    model_name = "stub-model"
+    temperature = 0.0
+    max_tokens = 16
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    async def ainvoke(self, prompt, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=self.replies.pop(0))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LLMResponseStore(str(tmp_path / "llm_cache.db"))
+
+
+def _invoke(client, prompt="prompt", **kwargs):
+    return asyncio.run(client.ainvoke(prompt, **kwargs)).content
+
+
+def test_repeat_prompt_served_from_cache(store):
+    model = StubChatModel(['{"ok": true}'])
+    client = CachedLLMClient(model, store=store)
+
+    assert _invoke(client) == '{"ok": true}'
+    assert _invoke(client) == '{"ok": true}'
+    assert len(model.calls) == 1
+
+
+def test_call_kwargs_are_part_of_the_key(store):
+    model = StubChatModel(["first", "second"])
+    client = CachedLLMClient(model, store=store)
+
+    assert _invoke(client, stop=["\n"]) == "first"
+    assert _invoke(client, stop=["END"]) == "second"
+    assert model.calls == [{"stop": ["\n"]}, {"stop": ["END"]}]
+
+
+def test_invalid_response_is_not_cached(store):
+    model = StubChatModel(["not json", '```json\n{"ok": true}\n```'])
+    client = CachedLLMClient(model, store=store)
+
+    assert _invoke(client, validate=llm_cache.parse_json_content) == "not json"
+    assert _invoke(client, validate=llm_cache.parse_json_content) == '```json\n{"ok": true}\n```'
+    assert _invoke(client, validate=llm_cache.parse_json_content) == '```json\n{"ok": true}\n```'
+    assert len(model.calls) == 2
+
+
+def test_expired_entries_are_misses(tmp_path):
+    store = LLMResponseStore(str(tmp_path / "llm_cache.db"), ttl_hours=1)
+    store.set("key", "content")
+    assert store.get("key") == "content"
+
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute("UPDATE llm_responses SET created_at = datetime('now', '-2 hours')")
+
+    assert store.get("key") is None
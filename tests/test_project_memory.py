@@ -0,0 +1,116 @@
+"""
+Tests for ProjectMemory's mtime-keyed project file cache and grouped agent events
+"""
+
+import json
+import os
+
+import pytest
+
+from src.orchestration import project_memory
+from src.orchestration.project_memory import ProjectMemory
+
+
+@pytest.fixture
+def memory(tmp_path):
+    return ProjectMemory(base_path=tmp_path)
+
+
+@pytest.fixture
+def json_loads_calls(monkeypatch):
+    calls = []
+    real_loads = json.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(args)
+        return real_loads(*args, **kwargs)
+
+    monkeypatch.setattr(project_memory.json, "loads", counting_loads)
+    return calls
+
+
+def _bump_mtime(path):
+    """Move the file's mtime forward so the change is visible at any timestamp resolution"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_missing_project_returns_empty_defaults(memory):
+    assert memory.get_version_history("absent") == []
+    assert memory.get_preferences("absent", "user") == {}
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, json_loads_calls):
+    ProjectMemory(base_path=tmp_path).record_version("proj", "v1", "upload", "abc")
+
+    reader = ProjectMemory(base_path=tmp_path)
+    for _ in range(3):
+        assert [v["version_id"] for v in reader.get_version_history("proj")] == ["v1"]
+
+    assert len(json_loads_calls) == 1
+
+
+def test_save_refreshes_cache_without_reparsing(memory, json_loads_calls):
+    memory.record_version("proj", "v1", "upload", "abc")
+    memory.record_version("proj", "v2", "upload", "def")
+
+    assert [v["version_id"] for v in memory.get_version_history("proj")] == ["v1", "v2"]
+    assert json_loads_calls == []
+
+
+def test_mutating_returned_data_does_not_touch_cache(memory):
+    memory.record_version("proj", "v1", "upload", "abc")
+    memory.record_preference("proj", "user", "tone", "formal")
+
+    memory.get_version_history("proj").append({"version_id": "bogus"})
+    memory.get_preferences("proj", "user")["tone"]["value"] = "casual"
+
+    assert [v["version_id"] for v in memory.get_version_history("proj")] == ["v1"]
+    assert memory.get_preferences("proj", "user")["tone"]["value"] == "formal"
+
+
+def test_external_write_is_picked_up(tmp_path):
+    reader = ProjectMemory(base_path=tmp_path)
+    writer = ProjectMemory(base_path=tmp_path)
+    writer.record_version("proj", "v1", "upload", "abc")
+    assert len(reader.get_version_history("proj")) == 1
+
+    writer.record_version("proj", "v2", "upload", "def")
+    _bump_mtime(tmp_path / "proj.json")
+
+    assert [v["version_id"] for v in reader.get_version_history("proj")] == ["v1", "v2"]
+
+
+def test_agent_events_grouped_by_version(memory):
+    memory.log_agent_event("proj", "v1", "reviewer", "review")
+    memory.log_agent_event("proj", "v2", "editor", "edit")
+    memory.log_agent_event("proj", "v1", "editor", "edit")
+
+    grouped = memory.get_agent_events_grouped("proj")
+
+    assert {version: [e["agent"] for e in events] for version, events in grouped.items()} == {
+        "v1": ["reviewer", "editor"],
+        "v2": ["editor"],
+    }
+    assert memory.get_agent_events_grouped("proj") is grouped
+
+
+def test_grouped_events_rebuilt_after_new_event(memory):
+    memory.log_agent_event("proj", "v1", "reviewer", "review")
+    assert len(memory.get_agent_events_grouped("proj")["v1"]) == 1
+
+    memory.log_agent_event("proj", "v1", "editor", "edit")
+
+    assert len(memory.get_agent_events_grouped("proj")["v1"]) == 2
+
+
+def test_grouped_events_rebuilt_after_external_write(tmp_path):
+    reader = ProjectMemory(base_path=tmp_path)
+    writer = ProjectMemory(base_path=tmp_path)
+    writer.log_agent_event("proj", "v1", "reviewer", "review")
+    assert list(reader.get_agent_events_grouped("proj")) == ["v1"]
+
+    writer.log_agent_event("proj", "v2", "editor", "edit")
+    _bump_mtime(tmp_path / "proj.json")
+
+    assert sorted(reader.get_agent_events_grouped("proj")) == ["v1", "v2"]
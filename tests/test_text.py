@@ -0,0 +1,19 @@
+"""
+Tests for the shared text helpers
+"""
+
+import pytest
+
+from src.utils.text import count_words
+
+
+@pytest.mark.parametrize('text', [
+    '',
+    '   ',
+    'one',
+    ' leading and trailing ',
+    'tabs\tand\nnewlines\r\nmixed  \x0b\x0c spacing',
+    'Clause 1.1 – “Services” means the café services',
+])
+def test_matches_str_split(text):
+    assert count_words(text) == len(text.split())
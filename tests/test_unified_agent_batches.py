@@ -0,0 +1,100 @@
+"""
+Tests for merging UnifiedContractAgent policy batches, with a stubbed LLM client
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+unified_agent = pytest.importorskip("src.agents.unified_agent")
+UnifiedContractAgent = unified_agent.UnifiedContractAgent
+
+
+def _finding(finding_id, severity, score=None, edit=False):
+    finding = {"finding_id": finding_id, "severity": severity}
+    if score is not None:
+        finding["risk_score"] = {"overall_score": score, "risk_level": severity}
+    if edit:
+        finding["suggested_edit"] = {"replacement": "..."}
+    return finding
+
+
+@pytest.fixture
+def agent():
+    return UnifiedContractAgent(llm=SimpleNamespace())
+
+
+def test_colliding_finding_ids_are_renamed(agent):
+    results = [
+        {"findings": [_finding("F1", "high"), _finding("F2", "low")]},
+        {"findings": [_finding("F1", "medium"), _finding("F1", "critical")]},
+        {"findings": [_finding("F1-b2", "low")]},
+    ]
+
+    merged = agent._merge_batch_results(results, "contract", policies_checked=20)
+
+    ids = [f["finding_id"] for f in merged["findings"]]
+    assert ids[:2] == ["F1", "F2"]
+    assert len(set(ids)) == len(ids) == 5
+
+
+def test_summary_recomputed_over_all_batches(agent):
+    results = [
+        {"findings": [_finding("F1", "high", score=8.0, edit=True)],
+         "summary": {"total_findings": 99, "key_themes": ["liability"]}},
+        {"findings": [_finding("F1", "low", score=2.0), _finding("F2", "low")],
+         "summary": {"key_themes": ["liability", "payment"]}},
+    ]
+
+    summary = agent._merge_batch_results(results, "contract", policies_checked=10)["summary"]
+
+    assert summary["total_findings"] == 3
+    assert summary["by_severity"] == {"critical": 0, "high": 1, "medium": 0, "low": 2}
+    assert summary["total_suggested_edits"] == 1
+    assert summary["key_themes"] == ["liability", "payment"]
+    assert summary["average_risk_score"] == 5.0
+    assert summary["highest_risk_finding"] == "F1"
+
+
+def test_failed_batches_reported_as_errors(agent):
+    results = [
+        {"findings": [_finding("F1", "high")]},
+        RuntimeError("timed out"),
+        {"findings": [], "error": "Failed to parse LLM response"},
+    ]
+
+    merged = agent._merge_batch_results(results, "contract", policies_checked=24)
+
+    assert len(merged["findings"]) == 1
+    assert merged["errors"] == [
+        "Policy batch 2 failed: timed out",
+        "Policy batch 3: Failed to parse LLM response",
+    ]
+    assert merged["analysis_metadata"]["policy_batches"] == 3
+    assert merged["analysis_metadata"]["policies_checked"] == 24
+
+
+def test_batched_analysis_merges_every_batch():
+    class StubLLM:
+        def __init__(self):
+            self.calls = 0
+
+        async def ainvoke(self, messages, **kwargs):
+            self.calls += 1
+            # Every batch numbers its findings from F1
+            return SimpleNamespace(content=json.dumps({"findings": [_finding("F1", "medium")]}))
+
+    llm = StubLLM()
+    agent = UnifiedContractAgent(llm=llm)
+    policies = [
+        {"policy_id": f"P{n}", "title": f"Policy {n}", "requirement": "..."}
+        for n in range(UnifiedContractAgent.POLICY_BATCH_SIZE * 2 + 1)
+    ]
+
+    merged = asyncio.run(agent.analyze_contract_batched("Contract text", policies, max_concurrency=2))
+
+    assert llm.calls == 3
+    assert [f["finding_id"] for f in merged["findings"]] == ["F1", "F1-b2", "F1-b3"]
+    assert merged["summary"]["total_findings"] == 3